@@ -4,17 +4,24 @@ This module handles all interactions with MinIO, including downloading CSV files
 listing objects, and moving files between prefixes.
 """
 
+import functools
 import io
 import os
-from collections.abc import Iterator
+import tempfile
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import hvac
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import urllib3
-from minio.commonconfig import CopySource
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 
-from dags.src.utils.helpers import setup_logger
+from dags.src.utils.helpers import CREDENTIAL_CACHE_TTL, setup_logger, ttl_cache
 from minio import Minio
 
 # Initialize logger
@@ -25,11 +32,242 @@ BUCKET_NAME = "data-platform"
 RAW_PREFIX = "raw/"
 PROCESSED_PREFIX = "processed/"
 CHUNK_SIZE_THRESHOLD = 1073741824  # 1GB in bytes
+STREAM_READ_SIZE = 65536  # 64KB reads from the object stream
+PARALLEL_DOWNLOAD_THRESHOLD = 67108864  # 64MB in bytes
+RANGE_PART_SIZE = 8388608  # 8MB per ranged GET
+RANGE_WORKERS = 8
+HTTP_POOL_SIZE = 32  # Connections kept open per host
+HTTP_TIMEOUT = 300  # Seconds, matching the minio client default
+# Files archived concurrently; each may use RANGE_WORKERS pooled connections
+MOVE_WORKERS = HTTP_POOL_SIZE // RANGE_WORKERS
+# Column types for raw CSVs; columns missing from a file are ignored. Text is
+# kept as strings so IDs and phone numbers never lose leading zeros, and the
+# low-cardinality product columns are categoricals (stored once per distinct
+# value, dictionary encoded in the Parquet archive). These parse for any cell.
+RAW_CSV_DTYPES = {
+    "order_id": "string[pyarrow]",
+    "customer_name": "string[pyarrow]",
+    "customer_email": "string[pyarrow]",
+    "customer_phone": "string[pyarrow]",
+    "customer_address": "string[pyarrow]",
+    "product_title": "category",
+    "product_category": "category",
+}
+# Numeric and date columns are inferred rather than fixed, so a malformed cell
+# leaves its column as strings for validation to quarantine the row instead of
+# failing the whole read. Columns that parse cleanly are narrowed to these
+# types: prices stay float64 so the two-decimal check sees exact values, and
+# integer columns are nullable so empty cells reach validation as missing.
+RAW_NUMERIC_TYPES = {
+    "product_rating": pa.float64(),
+    "discounted_price": pa.float64(),
+    "original_price": pa.float64(),
+    "discount_percentage": pa.int32(),
+    "quantity": pa.int32(),
+}
+RAW_DATE_COLUMNS = ["order_date", "delivery_date", "data_collected_at"]
+PARQUET_COMPRESSION = "zstd"
+
+# The fixed column types for pyarrow's CSV reader, and the pandas dtypes its
+# plain Arrow columns are converted to
+_ARROW_CSV_TYPES = {
+    "string[pyarrow]": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+}
+_ARROW_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types={column: _ARROW_CSV_TYPES[dtype] for column, dtype in RAW_CSV_DTYPES.items()},
+    strings_can_be_null=True,
+)
+_ARROW_NARROW_TYPES = {
+    **{column: (target, "numeric") for column, target in RAW_NUMERIC_TYPES.items()},
+    **{column: (pa.timestamp("ns"), "temporal") for column in RAW_DATE_COLUMNS},
+}
+_ARROW_PANDAS_TYPES = {pa.string(): pd.StringDtype("pyarrow"), pa.int32(): pd.Int32Dtype()}
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Raw stream replaying already-consumed bytes ahead of the rest of a response.
+
+    Lets the CSV header be inspected up front while ``pd.read_csv`` still
+    sees the complete object as one stream.
+    """
+
+    def __init__(self, prefix: bytes, response) -> None:
+        self._prefix = memoryview(prefix)
+        self._response = response
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+
+        data = self._response.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _read_header(response) -> bytes:
+    """Read from ``response`` until the first line is complete.
+
+    Args:
+        response: Object stream returned by ``Minio.get_object``.
+
+    Returns:
+        All bytes consumed, starting with the full header line (or the whole
+        object if it has no newline).
+    """
+    head = b""
+    while b"\n" not in head:
+        chunk = response.read(STREAM_READ_SIZE)
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _parallel_get(
+    minio_client: Minio,
+    object_key: str,
+    size: int,
+    part_size: int = RANGE_PART_SIZE,
+    workers: int = RANGE_WORKERS,
+) -> Iterator[bytes]:
+    """Download an object as concurrent ranged GETs, yielding parts in order.
+
+    At most ``workers`` parts are in flight or buffered at once, so memory
+    stays bounded by ``workers * part_size`` regardless of object size.
+
+    Args:
+        minio_client: Initialized MinIO client.
+        object_key: Object key (path) in the bucket.
+        size: Total object size in bytes.
+        part_size: Bytes per ranged request.
+        workers: Number of concurrent requests.
+
+    Yields:
+        Consecutive, non-overlapping byte ranges of the object.
+    """
+
+    def fetch(offset: int) -> bytes:
+        response = minio_client.get_object(
+            BUCKET_NAME,
+            object_key,
+            offset=offset,
+            length=min(part_size, size - offset),
+        )
+        try:
+            return response.read()
+        finally:
+            _close_response(response)
+
+    pending: deque[Future[bytes]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for offset in range(0, size, part_size):
+                pending.append(executor.submit(fetch, offset))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Abandoned early (error or closed iterator): drop queued ranges
+            for future in pending:
+                future.cancel()
+
+
+class _RangedResponse:
+    """File-like view over the in-order parts yielded by ``_parallel_get``."""
+
+    def __init__(self, parts: Iterator[bytes]) -> None:
+        self._parts = parts
+        self._part = b""
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            rest = self._part[self._pos :]
+            self._part, self._pos = b"", 0
+            return rest + b"".join(self._parts)
+
+        while self._pos >= len(self._part):
+            self._part = next(self._parts, b"")
+            self._pos = 0
+            if not self._part:
+                return b""
+
+        data = self._part[self._pos : self._pos + size]
+        self._pos += len(data)
+        return data
 
+    def close(self) -> None:
+        self._parts.close()
 
+    def release_conn(self) -> None:
+        pass
+
+
+def _close_response(response) -> None:
+    """Close a MinIO object stream and return its connection to the pool."""
+    response.close()
+    response.release_conn()
+
+
+def _narrow_inferred_columns(table: pa.Table) -> pa.Table:
+    """Cast cleanly inferred numeric and date columns to their raw types.
+
+    A column pyarrow had to infer as strings holds a malformed value and is
+    left as is, so validation rejects the affected rows.
+
+    Args:
+        table: Table read with ``_ARROW_CONVERT_OPTIONS``.
+
+    Returns:
+        Table with numeric columns as ``RAW_NUMERIC_TYPES`` and date columns
+        as ``timestamp[ns]`` wherever the inferred values allow it.
+    """
+    for index, field in enumerate(table.schema):
+        if field.name not in _ARROW_NARROW_TYPES:
+            continue
+        target, kind = _ARROW_NARROW_TYPES[field.name]
+        inferred = field.type
+        castable = pa.types.is_null(inferred) or (
+            pa.types.is_integer(inferred) or pa.types.is_floating(inferred)
+            if kind == "numeric"
+            else pa.types.is_date(inferred) or pa.types.is_timestamp(inferred)
+        )
+        if not castable or inferred == target:
+            continue
+        try:
+            column = table.column(index).cast(target)
+        except pa.ArrowInvalid:
+            # Values out of range for the target type; validation reports them
+            continue
+        table = table.set_column(index, field.name, column)
+    return table
+
+
+def _iter_chunks(
+    reader: Iterator[pd.DataFrame],
+    response,
+) -> Iterator[pd.DataFrame]:
+    """Yield CSV chunks, releasing the object stream once iteration ends."""
+    try:
+        yield from reader
+    finally:
+        _close_response(response)
+
+
+@ttl_cache(ttl=CREDENTIAL_CACHE_TTL)
 def get_minio_credentials(vault_client: hvac.Client) -> tuple[str, str, str, bool]:
     """Retrieve MinIO credentials from Vault.
 
+    Results are cached per Vault client for ``CREDENTIAL_CACHE_TTL`` seconds.
+
     Args:
         vault_client: Authenticated Vault client instance.
 
@@ -66,10 +304,81 @@ def get_minio_credentials(vault_client: hvac.Client) -> tuple[str, str, str, boo
         raise
 
 
+def _build_http_client(secure: bool) -> urllib3.PoolManager:
+    """Build the connection pool shared by all requests of a MinIO client.
+
+    Mirrors the minio default pool (timeouts and retries) but keeps up to
+    ``HTTP_POOL_SIZE`` connections per host open, so parallel ranged GETs and
+    repeated calls reuse connections instead of reconnecting.
+
+    Args:
+        secure: Whether the endpoint is served over HTTPS.
+
+    Returns:
+        Pool manager with strict SSL verification when ``secure`` is set.
+    """
+    ssl_kwargs = {}
+    if secure:
+        ca_cert_path = os.getenv("MINIO_CA_CERT", "/opt/airflow/certs/ca.crt")
+        if os.path.exists(ca_cert_path):
+            ssl_kwargs = {"cert_reqs": "CERT_REQUIRED", "ca_certs": ca_cert_path}
+            logger.info(f"Using CA certificate for SSL verification: {ca_cert_path}")
+        else:
+            logger.warning(
+                f"CA certificate not found at {ca_cert_path}, using default SSL verification"
+            )
+
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=HTTP_TIMEOUT, read=HTTP_TIMEOUT),
+        maxsize=HTTP_POOL_SIZE,
+        block=False,
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+        **ssl_kwargs,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _connect_minio(endpoint: str, access_key: str, secret_key: str, secure: bool) -> Minio:
+    """Create a MinIO client and verify the bucket, cached per credential set.
+
+    Args:
+        endpoint: MinIO host and port.
+        access_key: MinIO access key.
+        secret_key: MinIO secret key.
+        secure: Whether to connect over HTTPS.
+
+    Returns:
+        Initialized Minio client backed by a shared connection pool.
+
+    Raises:
+        ValueError: If the bucket does not exist.
+    """
+    client = Minio(
+        endpoint=endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=secure,
+        http_client=_build_http_client(secure),
+    )
+
+    # Verify connection by checking if bucket exists
+    if not client.bucket_exists(BUCKET_NAME):
+        raise ValueError(f"Bucket '{BUCKET_NAME}' does not exist")
+
+    logger.info(f"Successfully connected to MinIO at {endpoint}")
+    return client
+
+
 def get_minio_client(vault_client: hvac.Client) -> Minio:
     """Initialize and return a MinIO client using credentials from Vault.
 
     Uses strict SSL certificate verification for secure HTTPS connections.
+    The client is reused for as long as Vault returns the same credentials,
+    so its connection pool stays warm across calls.
 
     Args:
         vault_client: Authenticated Vault client instance.
@@ -82,37 +391,7 @@ def get_minio_client(vault_client: hvac.Client) -> Minio:
         S3Error: If MinIO connection fails.
     """
     try:
-        endpoint, access_key, secret_key, secure = get_minio_credentials(vault_client)
-
-        # Create custom HTTP client with strict SSL verification
-        http_client = None
-        if secure:
-            ca_cert_path = os.getenv("MINIO_CA_CERT", "/opt/airflow/certs/ca.crt")
-            if os.path.exists(ca_cert_path):
-                http_client = urllib3.PoolManager(
-                    cert_reqs="CERT_REQUIRED",
-                    ca_certs=ca_cert_path,
-                )
-                logger.info(f"Using CA certificate for SSL verification: {ca_cert_path}")
-            else:
-                logger.warning(
-                    f"CA certificate not found at {ca_cert_path}, using default SSL verification"
-                )
-
-        client = Minio(
-            endpoint=endpoint,
-            access_key=access_key,
-            secret_key=secret_key,
-            secure=secure,
-            http_client=http_client,
-        )
-
-        # Verify connection by checking if bucket exists
-        if not client.bucket_exists(BUCKET_NAME):
-            raise ValueError(f"Bucket '{BUCKET_NAME}' does not exist")
-
-        logger.info(f"Successfully connected to MinIO at {endpoint}")
-        return client
+        return _connect_minio(*get_minio_credentials(vault_client))
 
     except S3Error as e:
         logger.error(f"MinIO connection error: {str(e)}")
@@ -150,17 +429,26 @@ def get_raw_data(
     object_key: str,
     use_chunking: bool | None = None,
     chunk_size: int = 10000,
+    size: int | None = None,
 ) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """Download and read CSV data from MinIO.
 
-    For files larger than 1GB, returns an iterator of DataFrame chunks.
-    For smaller files, returns a single DataFrame.
+    The object is streamed into the CSV parser rather than downloaded into
+    memory first; objects over 64MB are fetched as parallel ranged GETs.
+    Text columns are parsed with the fixed types in ``RAW_CSV_DTYPES``. For
+    files larger than 1GB, returns an iterator of DataFrame chunks read by
+    pandas, with all other columns as strings, that releases the connection
+    once exhausted. Smaller files are parsed by pyarrow's multithreaded CSV
+    reader into a single DataFrame whose numeric and date columns are inferred
+    and narrowed by ``_narrow_inferred_columns``.
 
     Args:
         minio_client: Initialized MinIO client.
         object_key: Object key (path) in the bucket.
         use_chunking: Force chunking mode (None=auto-detect based on size).
         chunk_size: Number of rows per chunk when chunking (default: 10000).
+        size: Object size in bytes if already known (e.g. from ``list_raw_keys``);
+            skips the ``stat_object`` round-trip.
 
     Returns:
         DataFrame or iterator of DataFrame chunks.
@@ -168,63 +456,66 @@ def get_raw_data(
     Raises:
         S3Error: If download fails.
         pd.errors.ParserError: If CSV parsing fails.
+        pa.ArrowInvalid: If CSV parsing fails for a single DataFrame.
     """
     try:
+        object_size = size
+
         # Auto-detect chunking based on file size if not specified
         if use_chunking is None:
-            object_size = get_object_size(minio_client, object_key)
+            if object_size is None:
+                object_size = get_object_size(minio_client, object_key)
             use_chunking = object_size > CHUNK_SIZE_THRESHOLD
             if use_chunking:
                 logger.info(
                     f"File size ({object_size} bytes) exceeds threshold, using chunked processing"
                 )
 
-        # Get object data
-        response = minio_client.get_object(BUCKET_NAME, object_key)
-        data = response.read()
-        response.close()
-        response.release_conn()
-
-        # Determine which date columns to parse (only if they exist)
-        potential_date_columns = ["order_date", "delivery_date", "data_collected_at"]
-
-        # Read CSV header to check which columns exist
+        # Stream object data straight into the CSV parser, fetching large
+        # objects as parallel ranged GETs
+        if object_size is not None and object_size > PARALLEL_DOWNLOAD_THRESHOLD:
+            logger.info(f"Downloading '{object_key}' with {RANGE_WORKERS} parallel range requests")
+            parts = _parallel_get(
+                minio_client, object_key, object_size, RANGE_PART_SIZE, RANGE_WORKERS
+            )
+            response = _RangedResponse(parts)
+        else:
+            response = minio_client.get_object(BUCKET_NAME, object_key)
         try:
-            # Quick read to get column names only (use fresh BytesIO for each read)
-            df_header = pd.read_csv(io.BytesIO(data), nrows=0)
-            available_columns = df_header.columns.tolist()
-
-            # Only parse dates for columns that actually exist
-            date_columns = [col for col in potential_date_columns if col in available_columns]
+            head = _read_header(response)
         except Exception:
-            # If header read fails, don't parse any dates
-            date_columns = []
+            _close_response(response)
+            raise
+
+        stream = io.BufferedReader(_PrefixedStream(head, response), STREAM_READ_SIZE)
 
         # Convert to DataFrame or iterator
         if use_chunking:
+            # Every other column is read as strings, so a malformed cell in one
+            # chunk cannot give it different types from the others; validation
+            # parses the values
+            dtype = defaultdict(lambda: "string[pyarrow]", RAW_CSV_DTYPES)
+
             logger.info(f"Reading '{object_key}' in chunks of {chunk_size} rows")
-            if date_columns:
-                return pd.read_csv(
-                    io.BytesIO(data),
-                    chunksize=chunk_size,
-                    parse_dates=date_columns,
-                )
-            else:
-                return pd.read_csv(io.BytesIO(data), chunksize=chunk_size)
-        else:
-            logger.info(f"Reading '{object_key}' as single DataFrame")
-            if date_columns:
-                return pd.read_csv(
-                    io.BytesIO(data),
-                    parse_dates=date_columns,
-                )
-            else:
-                return pd.read_csv(io.BytesIO(data))
+            try:
+                reader = pd.read_csv(stream, chunksize=chunk_size, engine="c", dtype=dtype)
+            except Exception:
+                _close_response(response)
+                raise
+            return _iter_chunks(reader, response)
+
+        # Columns missing from the file are skipped by the convert options
+        logger.info(f"Reading '{object_key}' as single DataFrame")
+        try:
+            table = pa_csv.read_csv(stream, convert_options=_ARROW_CONVERT_OPTIONS)
+        finally:
+            _close_response(response)
+        return _narrow_inferred_columns(table).to_pandas(types_mapper=_ARROW_PANDAS_TYPES.get)
 
     except S3Error as e:
         logger.error(f"Failed to download object '{object_key}': {str(e)}")
         raise
-    except pd.errors.ParserError as e:
+    except (pd.errors.ParserError, pa.ArrowInvalid) as e:
         logger.error(f"Failed to parse CSV from '{object_key}': {str(e)}")
         raise
     except Exception as e:
@@ -232,63 +523,170 @@ def get_raw_data(
         raise
 
 
-def list_raw_keys(minio_client: Minio, prefix: str = RAW_PREFIX) -> list[str]:
-    """List all object keys in the specified prefix.
+def list_raw_keys(minio_client: Minio, prefix: str = RAW_PREFIX) -> Iterator[tuple[str, int]]:
+    """Lazily list all object keys in the specified prefix along with their sizes.
+
+    Keys are yielded as the listing pages arrive, so callers can start work
+    before the whole prefix has been listed. Sizes come from the listing
+    itself and can be passed on to ``get_raw_data`` instead of issuing a
+    ``stat_object`` per key.
 
     Args:
         minio_client: Initialized MinIO client.
         prefix: Prefix to list objects from (default: 'raw/').
 
-    Returns:
-        List of object keys (paths).
+    Yields:
+        (object key, size in bytes) tuples.
 
     Raises:
         S3Error: If listing operation fails.
     """
+    count = 0
     try:
-        objects = minio_client.list_objects(BUCKET_NAME, prefix=prefix, recursive=True)
-        keys = [obj.object_name for obj in objects]
-        logger.info(f"Found {len(keys)} objects with prefix '{prefix}'")
-        return keys
+        for obj in minio_client.list_objects(BUCKET_NAME, prefix=prefix, recursive=True):
+            count += 1
+            yield obj.object_name, obj.size
     except S3Error as e:
         logger.error(f"Failed to list objects with prefix '{prefix}': {str(e)}")
         raise
+    logger.info(f"Found {count} objects with prefix '{prefix}'")
+
+
+def _with_int32_dictionary_indices(schema: pa.Schema) -> pa.Schema:
+    """Return ``schema`` with every dictionary column indexed by int32."""
+    fields = [
+        field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        if pa.types.is_dictionary(field.type)
+        else field
+        for field in schema
+    ]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _write_parquet(data: pd.DataFrame | Iterator[pd.DataFrame], sink) -> None:
+    """Encode raw data as a zstd-compressed Parquet file.
+
+    Categorical columns (see ``RAW_CSV_DTYPES``) are dictionary encoded and read
+    back as ``category``. Chunked input is written one row group per chunk,
+    cast to the schema of the first chunk. Dictionary indices in that schema
+    are widened to int32, since pandas sizes each chunk's category codes by
+    its own number of distinct values.
+
+    Args:
+        data: DataFrame or iterator of DataFrame chunks from ``get_raw_data``.
+        sink: Writable binary file object receiving the Parquet bytes.
+
+    Raises:
+        pa.ArrowException: If a chunk cannot be converted to the file schema.
+    """
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(
+                chunk,
+                schema=writer.schema if writer else None,
+                preserve_index=False,
+            )
+            if writer is None:
+                table = table.cast(_with_int32_dictionary_indices(table.schema))
+                writer = pq.ParquetWriter(sink, table.schema, compression=PARQUET_COMPRESSION)
+            writer.write_table(table)
+
+        if writer is None:
+            pq.write_table(pa.table({}), sink, compression=PARQUET_COMPRESSION)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _archive_as_parquet(
+    minio_client: Minio,
+    source_key: str,
+    destination_prefix: str,
+    data: pd.DataFrame | None = None,
+    size: int | None = None,
+) -> str:
+    """Transcode a raw CSV object to Parquet and upload it under ``destination_prefix``.
+
+    The data is encoded into a temporary file that spills to disk once it
+    outgrows memory. Unless ``data`` is given, the raw CSV is read back
+    through ``get_raw_data`` first. The source object is left in place.
+
+    Args:
+        minio_client: Initialized MinIO client.
+        source_key: Source object key under raw/.
+        destination_prefix: Destination prefix.
+        data: Contents of ``source_key`` as returned by ``get_raw_data``, if
+            already in memory.
+        size: Object size in bytes if already known; passed on to
+            ``get_raw_data`` when the CSV is read back.
+
+    Returns:
+        Destination object key (same base name with a ``.parquet`` extension).
+    """
+    # Extract base name from source key
+    filename = source_key[len(RAW_PREFIX) :]
+    destination_key = f"{destination_prefix}{os.path.splitext(filename)[0]}.parquet"
+
+    with tempfile.SpooledTemporaryFile(max_size=PARALLEL_DOWNLOAD_THRESHOLD) as buffer:
+        if data is None:
+            data = get_raw_data(minio_client, source_key, size=size)
+        _write_parquet(data, buffer)
+        length = buffer.tell()
+        buffer.seek(0)
+
+        # Upload Parquet archive to new location
+        minio_client.put_object(
+            BUCKET_NAME,
+            destination_key,
+            buffer,
+            length=length,
+            content_type="application/vnd.apache.parquet",
+        )
+    logger.info(f"Archived '{source_key}' to '{destination_key}' ({length} bytes)")
+    return destination_key
 
 
 def move_processed_file(
     minio_client: Minio,
     source_key: str,
     destination_prefix: str = PROCESSED_PREFIX,
+    data: pd.DataFrame | None = None,
+    size: int | None = None,
 ) -> str:
-    """Move a file from raw/ to processed/ prefix.
+    """Archive a file from raw/ to the processed/ prefix as Parquet.
+
+    The raw CSV is transcoded to Parquet, uploaded under the same base name
+    with a ``.parquet`` extension, and then removed from raw/. Passing the
+    DataFrame already read from ``source_key`` skips downloading and parsing
+    the CSV a second time.
 
     Args:
         minio_client: Initialized MinIO client.
         source_key: Source object key (must start with 'raw/').
         destination_prefix: Destination prefix (default: 'processed/').
+        data: Unmodified DataFrame returned by ``get_raw_data`` for
+            ``source_key`` (default: read the object again).
+        size: Object size in bytes if already known (e.g. from
+            ``get_object_size``); skips the ``stat_object`` round-trip when
+            the object is read again.
 
     Returns:
         Destination object key.
 
     Raises:
         ValueError: If source_key doesn't start with 'raw/'.
-        S3Error: If copy or delete operation fails.
+        S3Error: If download, upload or delete operation fails.
+        pa.ArrowException: If the data cannot be encoded as Parquet.
     """
     if not source_key.startswith(RAW_PREFIX):
         raise ValueError(f"Source key must start with '{RAW_PREFIX}', got: {source_key}")
 
     try:
-        # Extract filename from source key
-        filename = source_key[len(RAW_PREFIX) :]
-        destination_key = f"{destination_prefix}{filename}"
-
-        # Copy object to new location
-        minio_client.copy_object(
-            bucket_name=BUCKET_NAME,
-            object_name=destination_key,
-            source=CopySource(BUCKET_NAME, source_key),
+        destination_key = _archive_as_parquet(
+            minio_client, source_key, destination_prefix, data, size
         )
-        logger.info(f"Copied '{source_key}' to '{destination_key}'")
 
         # Remove original object
         minio_client.remove_object(BUCKET_NAME, source_key)
@@ -299,3 +697,65 @@ def move_processed_file(
     except S3Error as e:
         logger.error(f"Failed to move object from '{source_key}': {str(e)}")
         raise
+    except pa.ArrowException as e:
+        logger.error(f"Failed to encode '{source_key}' as Parquet: {str(e)}")
+        raise
+
+
+def move_processed_files(
+    minio_client: Minio,
+    source_keys: Iterable[str],
+    destination_prefix: str = PROCESSED_PREFIX,
+) -> list[str]:
+    """Archive several files from raw/ to the processed/ prefix as Parquet.
+
+    Files are archived concurrently (``MOVE_WORKERS`` at a time) and the
+    originals are then deleted with a single multi-object delete request.
+    If any archive fails, no raw object is removed.
+
+    Args:
+        minio_client: Initialized MinIO client.
+        source_keys: Source object keys (each must start with 'raw/').
+        destination_prefix: Destination prefix (default: 'processed/').
+
+    Returns:
+        Destination object keys, in the order of ``source_keys``.
+
+    Raises:
+        ValueError: If any source key doesn't start with 'raw/'.
+        S3Error: If a download, upload or delete request fails.
+        pa.ArrowException: If the data cannot be encoded as Parquet.
+        RuntimeError: If MinIO reports that some raw objects were not deleted.
+    """
+    source_keys = list(source_keys)
+    invalid = [key for key in source_keys if not key.startswith(RAW_PREFIX)]
+    if invalid:
+        raise ValueError(f"Source keys must start with '{RAW_PREFIX}', got: {invalid}")
+
+    try:
+        with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+            destination_keys = list(
+                executor.map(
+                    lambda key: _archive_as_parquet(minio_client, key, destination_prefix),
+                    source_keys,
+                )
+            )
+
+        # Remove originals in one batch; the iterator must be consumed to send it
+        errors = list(
+            minio_client.remove_objects(BUCKET_NAME, [DeleteObject(key) for key in source_keys])
+        )
+        if errors:
+            details = "; ".join(f"{error.name}: {error.message}" for error in errors)
+            logger.error(f"Failed to remove {len(errors)} raw objects: {details}")
+            raise RuntimeError(f"Failed to remove {len(errors)} raw objects: {details}")
+        logger.info(f"Removed {len(source_keys)} original objects")
+
+        return destination_keys
+
+    except S3Error as e:
+        logger.error(f"Failed to move objects to '{destination_prefix}': {str(e)}")
+        raise
+    except pa.ArrowException as e:
+        logger.error(f"Failed to encode raw objects as Parquet: {str(e)}")
+        raise
@@ -4,23 +4,70 @@ This module handles database connections and upserts data into the star schema,
 managing dimension tables first, then fact tables.
 """
 
+import io
 import os
+import struct
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import hvac
+import numpy as np
 import pandas as pd
 import psycopg2
+import pyarrow as pa
 from psycopg2.extensions import connection as PgConnection
+from psycopg2.extras import execute_values
 
-from dags.src.utils.helpers import setup_logger
+from dags.src.utils.helpers import CREDENTIAL_CACHE_TTL, setup_logger, ttl_cache
 
 # Initialize logger
 logger = setup_logger("loading", "logs/loading.log")
 
-
+# Constants
+BATCH_PAGE_SIZE = 5000  # Rows per multi-VALUES statement in execute_values
+
+# fact_sales columns in COPY order with their binary wire encoding
+FACT_SALES_LAYOUT = (
+    ("order_id", "text"),
+    ("customer_id", "int4"),
+    ("product_id", "int4"),
+    ("order_date_id", "int4"),
+    ("delivery_date_id", "int4"),
+    ("quantity", "int4"),
+    ("discounted_price", "float8"),
+    ("original_price", "float8"),
+    ("discount_percentage", "int4"),
+    ("profit", "float8"),
+    ("data_collected_at", "date"),
+)
+FACT_SALES_COLUMNS = ", ".join(name for name, _ in FACT_SALES_LAYOUT)
+
+# Frame columns staged for dim_customer, in staging table column order
+DIM_CUSTOMER_LAYOUT = (
+    ("customer_name", "text"),
+    ("customer_email_hash", "text"),
+    ("customer_phone_redacted", "text"),
+    ("customer_address_redacted", "text"),
+)
+
+# PostgreSQL binary COPY framing
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+PG_EPOCH = pd.Timestamp("2000-01-01")
+
+COPY_BUFFER_SIZE = 1048576  # 1MB CopyData messages instead of psycopg2's 8KB default
+# Rows encoded per batch; text blocks are padded to the batch's longest value,
+# so this bounds them at ~10k x 255 bytes per column for VARCHAR(255) fields
+COPY_ENCODE_BATCH_ROWS = 10000
+
+
+@ttl_cache(ttl=CREDENTIAL_CACHE_TTL)
 def get_postgres_credentials(vault_client: hvac.Client) -> dict[str, str]:
     """Retrieve PostgreSQL credentials from Vault.
 
+    Results are cached per Vault client for ``CREDENTIAL_CACHE_TTL`` seconds;
+    treat the returned dictionary as read-only.
+
     Args:
         vault_client: Authenticated Vault client instance.
 
@@ -114,12 +161,17 @@ def upsert_dimension_customer(
 ) -> pd.DataFrame:
     """Upsert customer dimension data and return DataFrame with customer_ids.
 
+    Unique customers are streamed into a temporary staging table with binary
+    ``COPY FROM STDIN`` and merged into ``dim_customer`` with one ``INSERT ...
+    SELECT ... ON CONFLICT ... RETURNING`` statement, so no per-row SQL is
+    rendered client-side.
+
     Args:
         conn: PostgreSQL connection.
         df: DataFrame with customer data.
 
     Returns:
-        DataFrame with customer_id column added.
+        ``df`` itself, with the customer_id column added in place.
 
     Raises:
         psycopg2.Error: If database operation fails.
@@ -129,44 +181,52 @@ def upsert_dimension_customer(
     cursor = conn.cursor()
 
     try:
-        # Get unique customers from the DataFrame
-        customers = df[
+        # Get unique customers, copying only the first row per email hash
+        customers = df.loc[
+            ~df["customer_email_hash"].duplicated(),
             [
                 "customer_name",
                 "customer_email_hash",
                 "customer_phone_redacted",
                 "customer_address_redacted",
-            ]
-        ].drop_duplicates(subset=["customer_email_hash"])
-
-        # Upsert each customer
-        for _, row in customers.iterrows():
-            cursor.execute(
-                """
-                INSERT INTO dim_customer (customer_name, email_hash, phone_redacted, address_redacted)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (email_hash)
-                DO UPDATE SET
-                    customer_name = EXCLUDED.customer_name,
-                    phone_redacted = EXCLUDED.phone_redacted,
-                    address_redacted = EXCLUDED.address_redacted,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING customer_id
-                """,
-                (
-                    row["customer_name"],
-                    row["customer_email_hash"],
-                    row["customer_phone_redacted"],
-                    row["customer_address_redacted"],
-                ),
-            )
-            customer_id = cursor.fetchone()[0]
-
-            # Add customer_id to original DataFrame
-            df.loc[
-                df["customer_email_hash"] == row["customer_email_hash"],
-                "customer_id",
-            ] = customer_id
+            ],
+        ]
+
+        # Stage all customers and upsert them in one statement
+        cursor.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS stg_dim_customer (
+                customer_name TEXT,
+                email_hash TEXT,
+                phone_redacted TEXT,
+                address_redacted TEXT
+            ) ON COMMIT DROP
+            """
+        )
+        cursor.copy_expert(
+            "COPY stg_dim_customer FROM STDIN WITH (FORMAT BINARY)",
+            io.BytesIO(_encode_pgcopy_binary(customers, DIM_CUSTOMER_LAYOUT)),
+            size=COPY_BUFFER_SIZE,
+        )
+        cursor.execute(
+            """
+            INSERT INTO dim_customer (customer_name, email_hash, phone_redacted, address_redacted)
+            SELECT customer_name, email_hash, phone_redacted, address_redacted
+            FROM stg_dim_customer
+            ON CONFLICT (email_hash)
+            DO UPDATE SET
+                customer_name = EXCLUDED.customer_name,
+                phone_redacted = EXCLUDED.phone_redacted,
+                address_redacted = EXCLUDED.address_redacted,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING customer_id, email_hash
+            """
+        )
+        rows = cursor.fetchall()
+
+        # Add customer_id to original DataFrame
+        customer_ids = {email_hash: customer_id for customer_id, email_hash in rows}
+        df["customer_id"] = df["customer_email_hash"].map(customer_ids)
 
         conn.commit()
         logger.info(f"Successfully upserted {len(customers)} unique customers")
@@ -191,7 +251,7 @@ def upsert_dimension_product(
         df: DataFrame with product data.
 
     Returns:
-        DataFrame with product_id column added.
+        ``df`` itself, with the product_id column added in place.
 
     Raises:
         psycopg2.Error: If database operation fails.
@@ -201,38 +261,42 @@ def upsert_dimension_product(
     cursor = conn.cursor()
 
     try:
-        # Get unique products
-        products = df[
-            ["product_title", "product_rating", "product_category", "is_best_seller"]
-        ].drop_duplicates(subset=["product_title", "product_category"])
-
-        for _, row in products.iterrows():
-            cursor.execute(
-                """
-                INSERT INTO dim_product
-                    (product_title, product_rating, product_category, is_best_seller)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (product_title, product_category)
-                DO UPDATE SET
-                    product_rating = EXCLUDED.product_rating,
-                    is_best_seller = EXCLUDED.is_best_seller,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING product_id
-                """,
-                (
-                    row["product_title"],
-                    row["product_rating"],
-                    row["product_category"],
-                    row["is_best_seller"],
-                ),
-            )
-            product_id = cursor.fetchone()[0]
-
-            # Add product_id to DataFrame
-            mask = (df["product_title"] == row["product_title"]) & (
-                df["product_category"] == row["product_category"]
-            )
-            df.loc[mask, "product_id"] = product_id
+        # Get unique products, copying only the first row per title/category
+        products = df.loc[
+            ~df.duplicated(subset=["product_title", "product_category"]),
+            ["product_title", "product_rating", "product_category", "is_best_seller"],
+        ]
+
+        rows = execute_values(
+            cursor,
+            """
+            INSERT INTO dim_product
+                (product_title, product_rating, product_category, is_best_seller)
+            VALUES %s
+            ON CONFLICT (product_title, product_category)
+            DO UPDATE SET
+                product_rating = EXCLUDED.product_rating,
+                is_best_seller = EXCLUDED.is_best_seller,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING product_id, product_title, product_category
+            """,
+            list(products.itertuples(index=False, name=None)),
+            page_size=BATCH_PAGE_SIZE,
+            fetch=True,
+        )
+
+        # Add product_id to DataFrame
+        product_ids = pd.Series(
+            [product_id for product_id, _, _ in rows],
+            index=pd.MultiIndex.from_tuples(
+                [(title, category) for _, title, category in rows],
+                names=["product_title", "product_category"],
+            ),
+            dtype="float64",
+        )
+        df["product_id"] = product_ids.reindex(
+            pd.MultiIndex.from_arrays([df["product_title"], df["product_category"]])
+        ).to_numpy()
 
         conn.commit()
         logger.info(f"Successfully upserted {len(products)} unique products")
@@ -257,7 +321,7 @@ def upsert_dimension_date(
         df: DataFrame with date columns.
 
     Returns:
-        DataFrame with order_date_id and delivery_date_id columns.
+        ``df`` itself, with order_date_id and delivery_date_id columns added in place.
 
     Raises:
         psycopg2.Error: If database operation fails.
@@ -267,30 +331,34 @@ def upsert_dimension_date(
     cursor = conn.cursor()
 
     try:
-        # Get unique dates from both order_date and delivery_date
-        dates = pd.concat([df["order_date"], df["delivery_date"]]).dropna().unique()
-
-        for date_val in dates:
-            date_val = pd.to_datetime(date_val)
-
-            cursor.execute(
-                """
-                INSERT INTO dim_date
-                    (date, year, month, day, quarter, day_of_week, week_of_year, is_weekend)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (date) DO NOTHING
-                """,
-                (
-                    date_val.date(),
-                    date_val.year,
-                    date_val.month,
-                    date_val.day,
-                    (date_val.month - 1) // 3 + 1,  # Calculate quarter
-                    date_val.dayofweek,
-                    date_val.isocalendar()[1],  # Week of year
-                    date_val.dayofweek >= 5,  # Weekend check
-                ),
-            )
+        # Get unique dates from both order_date and delivery_date, deduplicating
+        # each column first so only the distinct values are concatenated
+        distinct = [pd.Series(df[col].unique()) for col in ("order_date", "delivery_date")]
+        dates = pd.to_datetime(pd.concat(distinct, ignore_index=True).dropna().unique())
+
+        execute_values(
+            cursor,
+            """
+            INSERT INTO dim_date
+                (date, year, month, day, quarter, day_of_week, week_of_year, is_weekend)
+            VALUES %s
+            ON CONFLICT (date) DO NOTHING
+            """,
+            list(
+                zip(
+                    dates.date,
+                    dates.year.tolist(),
+                    dates.month.tolist(),
+                    dates.day.tolist(),
+                    dates.quarter.tolist(),
+                    dates.dayofweek.tolist(),
+                    dates.isocalendar().week.tolist(),  # Week of year
+                    (dates.dayofweek >= 5).tolist(),  # Weekend check
+                    strict=True,
+                )
+            ),
+            page_size=BATCH_PAGE_SIZE,
+        )
 
         conn.commit()
 
@@ -298,12 +366,8 @@ def upsert_dimension_date(
         cursor.execute("SELECT date_id, date FROM dim_date")
         date_mapping = {date: date_id for date_id, date in cursor.fetchall()}
 
-        df["order_date_id"] = df["order_date"].apply(
-            lambda x: date_mapping.get(pd.to_datetime(x).date()) if pd.notna(x) else None
-        )
-        df["delivery_date_id"] = df["delivery_date"].apply(
-            lambda x: date_mapping.get(pd.to_datetime(x).date()) if pd.notna(x) else None
-        )
+        df["order_date_id"] = pd.to_datetime(df["order_date"]).dt.date.map(date_mapping)
+        df["delivery_date_id"] = pd.to_datetime(df["delivery_date"]).dt.date.map(date_mapping)
 
         logger.info(f"Successfully upserted {len(dates)} unique dates")
         return df
@@ -316,12 +380,122 @@ def upsert_dimension_date(
         cursor.close()
 
 
+def _text_block(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Lay out a text column as a padded ``(rows, width)`` block of UTF-8 bytes.
+
+    The column is converted to an Arrow string array, which already holds
+    every value back to back in one UTF-8 buffer with an offsets array, so
+    each row's bytes are gathered straight from that buffer instead of being
+    encoded value by value.
+
+    Args:
+        series: Column to encode; values are converted to strings.
+
+    Returns:
+        Tuple of (padded byte block, byte length of each value). Missing
+        values have length 0; bytes past each length are padding.
+    """
+    array = pa.array(series, from_pandas=True)
+    if isinstance(array, pa.ChunkedArray):
+        # Multi-chunk string[pyarrow] columns come back chunked
+        array = array.combine_chunks()
+    array = array.cast(pa.string())
+    offsets = np.frombuffer(array.buffers()[1], dtype=np.int32)
+    offsets = offsets[array.offset : array.offset + len(array) + 1]
+    utf8 = array.buffers()[2]
+    buffer = np.frombuffer(utf8, dtype=np.uint8) if utf8 is not None else np.empty(0, np.uint8)
+
+    lengths = np.diff(offsets)
+    width = int(lengths.max(initial=0))
+    positions = offsets[:-1, None] + np.arange(width, dtype=np.int32)
+    return buffer[np.minimum(positions, len(buffer) - 1)], lengths
+
+
+def _encode_pgcopy_binary(
+    df: pd.DataFrame,
+    layout: tuple[tuple[str, str], ...],
+) -> bytes:
+    """Serialize DataFrame columns into a PostgreSQL binary COPY payload.
+
+    Rows are encoded ``COPY_ENCODE_BATCH_ROWS`` at a time by
+    ``_encode_pgcopy_rows``, so the padded text blocks stay bounded by the
+    batch size rather than growing with the whole frame.
+
+    Args:
+        df: DataFrame containing every column named in ``layout``.
+        layout: ``(column, encoding)`` pairs in COPY order, where encoding is
+            one of ``text``, ``int4``, ``float8`` or ``date``.
+
+    Returns:
+        Complete ``COPY ... WITH (FORMAT BINARY)`` payload including header
+        and trailer. Missing values are written as NULL fields.
+    """
+    batches = (
+        _encode_pgcopy_rows(df.iloc[start : start + COPY_ENCODE_BATCH_ROWS], layout)
+        for start in range(0, len(df), COPY_ENCODE_BATCH_ROWS)
+    )
+    return PGCOPY_HEADER + b"".join(batches) + PGCOPY_TRAILER
+
+
+def _encode_pgcopy_rows(
+    df: pd.DataFrame,
+    layout: tuple[tuple[str, str], ...],
+) -> bytes:
+    """Encode a non-empty batch of rows as binary COPY tuples.
+
+    Each column is encoded as a whole with NumPy: values become a padded
+    ``(rows, width)`` byte block next to a mask of the bytes actually sent.
+    Concatenating the blocks and applying the mask in row-major order yields
+    the row-interleaved wire format, including variable-width text and NULL
+    fields, without a Python-level loop over rows.
+
+    Args:
+        df: Rows to encode, containing every column named in ``layout``.
+        layout: ``(column, encoding)`` pairs in COPY order.
+
+    Returns:
+        Tuple data for the rows, without the COPY header and trailer.
+    """
+    n_rows = len(df)
+
+    # Per-row field count
+    blocks = [np.full(n_rows, len(layout), dtype=">i2").view(np.uint8).reshape(n_rows, 2)]
+    masks = [np.ones((n_rows, 2), dtype=bool)]
+
+    for name, encoding in layout:
+        series = df[name]
+        present = series.notna().to_numpy()
+
+        if encoding == "text":
+            data, lengths = _text_block(series)
+        else:
+            if encoding == "date":
+                series = (pd.to_datetime(series) - PG_EPOCH).dt.days
+            wire_dtype = ">f8" if encoding == "float8" else ">i4"
+            values = series.to_numpy(dtype=wire_dtype, na_value=0)
+            lengths = np.where(present, values.dtype.itemsize, 0)
+            data = np.ascontiguousarray(values).view(np.uint8).reshape(n_rows, -1)
+
+        width = data.shape[1]
+        length_prefix = np.where(present, lengths, -1).astype(">i4")
+
+        blocks += [length_prefix.view(np.uint8).reshape(n_rows, 4), data]
+        masks += [np.ones((n_rows, 4), dtype=bool), np.arange(width) < lengths[:, None]]
+
+    rows = np.concatenate(blocks, axis=1)[np.concatenate(masks, axis=1)]
+    return rows.tobytes()
+
+
 def upsert_fact_sales(
     conn: PgConnection,
     df: pd.DataFrame,
 ) -> None:
     """Upsert fact sales data.
 
+    Rows are streamed into a temporary staging table with binary
+    ``COPY FROM STDIN`` and merged into ``fact_sales`` with a single ``INSERT ... SELECT ... ON
+    CONFLICT`` statement, instead of one round-trip per row.
+
     Args:
         conn: PostgreSQL connection.
         df: DataFrame with complete sales fact data (including dimension IDs).
@@ -331,49 +505,59 @@ def upsert_fact_sales(
     """
     logger.info(f"Upserting {len(df)} sales fact records")
 
+    # Last occurrence wins, matching the previous row-by-row upsert order; the
+    # frame is only copied when there actually are duplicates to drop
+    duplicated = df["order_id"].duplicated(keep="last")
+    facts = df[~duplicated] if duplicated.any() else df
+    copy_buffer = io.BytesIO(_encode_pgcopy_binary(facts, FACT_SALES_LAYOUT))
+
     cursor = conn.cursor()
 
     try:
-        for _, row in df.iterrows():
-            cursor.execute(
-                """
-                INSERT INTO fact_sales (
-                    order_id, customer_id, product_id, order_date_id, delivery_date_id,
-                    quantity, discounted_price, original_price, discount_percentage,
-                    profit, data_collected_at
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (order_id)
-                DO UPDATE SET
-                    customer_id = EXCLUDED.customer_id,
-                    product_id = EXCLUDED.product_id,
-                    order_date_id = EXCLUDED.order_date_id,
-                    delivery_date_id = EXCLUDED.delivery_date_id,
-                    quantity = EXCLUDED.quantity,
-                    discounted_price = EXCLUDED.discounted_price,
-                    original_price = EXCLUDED.original_price,
-                    discount_percentage = EXCLUDED.discount_percentage,
-                    profit = EXCLUDED.profit,
-                    data_collected_at = EXCLUDED.data_collected_at,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                (
-                    row["order_id"],
-                    int(row["customer_id"]),
-                    int(row["product_id"]),
-                    int(row["order_date_id"]),
-                    int(row["delivery_date_id"]) if pd.notna(row["delivery_date_id"]) else None,
-                    row["quantity"],
-                    row["discounted_price"],
-                    row["original_price"],
-                    row["discount_percentage"],
-                    row["profit"],
-                    pd.to_datetime(row["data_collected_at"]).date(),
-                ),
-            )
+        cursor.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS stg_fact_sales (
+                order_id VARCHAR(10),
+                customer_id INT,
+                product_id INT,
+                order_date_id INT,
+                delivery_date_id INT,
+                quantity INT,
+                discounted_price DOUBLE PRECISION,
+                original_price DOUBLE PRECISION,
+                discount_percentage INT,
+                profit DOUBLE PRECISION,
+                data_collected_at DATE
+            ) ON COMMIT DROP
+            """
+        )
+        cursor.copy_expert(
+            f"COPY stg_fact_sales ({FACT_SALES_COLUMNS}) FROM STDIN WITH (FORMAT BINARY)",
+            copy_buffer,
+            size=COPY_BUFFER_SIZE,
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO fact_sales ({FACT_SALES_COLUMNS})
+            SELECT {FACT_SALES_COLUMNS} FROM stg_fact_sales
+            ON CONFLICT (order_id)
+            DO UPDATE SET
+                customer_id = EXCLUDED.customer_id,
+                product_id = EXCLUDED.product_id,
+                order_date_id = EXCLUDED.order_date_id,
+                delivery_date_id = EXCLUDED.delivery_date_id,
+                quantity = EXCLUDED.quantity,
+                discounted_price = EXCLUDED.discounted_price,
+                original_price = EXCLUDED.original_price,
+                discount_percentage = EXCLUDED.discount_percentage,
+                profit = EXCLUDED.profit,
+                data_collected_at = EXCLUDED.data_collected_at,
+                updated_at = CURRENT_TIMESTAMP
+            """
+        )
 
         conn.commit()
-        logger.info(f"Successfully upserted {len(df)} sales records")
+        logger.info(f"Successfully upserted {len(facts)} sales records")
 
     except psycopg2.Error as e:
         conn.rollback()
@@ -383,14 +567,24 @@ def upsert_fact_sales(
         cursor.close()
 
 
+# Dimension upserts run concurrently, each on its own connection, together with
+# the ID columns each one adds to the frame
+DIMENSION_UPSERTS = (
+    (upsert_dimension_customer, ("customer_id",)),
+    (upsert_dimension_product, ("product_id",)),
+    (upsert_dimension_date, ("order_date_id", "delivery_date_id")),
+)
+
+
 def upsert_data(
     vault_client: hvac.Client,
     data: pd.DataFrame | Iterator[pd.DataFrame],
 ) -> None:
     """Upsert data into PostgreSQL star schema.
 
-    Loads dimension tables first (customer, product, date), then fact table.
-    Handles both single DataFrames and chunked iterators.
+    Loads the dimension tables (customer, product, date) concurrently on one
+    connection each, then the fact table. Handles both single DataFrames and
+    chunked iterators.
 
     Args:
         vault_client: Authenticated Vault client.
@@ -399,54 +593,74 @@ def upsert_data(
     Raises:
         psycopg2.Error: If database operations fail.
     """
-    conn = None
+    connections: list[PgConnection] = []
 
     try:
-        conn = get_postgres_connection(vault_client)
-
-        if isinstance(data, pd.DataFrame):
-            _upsert_single_dataframe(conn, data)
-        elif isinstance(data, Iterator):
-            _upsert_chunked_dataframes(conn, data)
-        else:
-            raise TypeError(
-                f"Data must be pd.DataFrame or Iterator[pd.DataFrame], got {type(data)}"
-            )
+        for _ in DIMENSION_UPSERTS:
+            connections.append(get_postgres_connection(vault_client))
+
+        with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+            if isinstance(data, pd.DataFrame):
+                _upsert_single_dataframe(connections, executor, data)
+            elif isinstance(data, Iterator):
+                _upsert_chunked_dataframes(connections, executor, data)
+            else:
+                raise TypeError(
+                    f"Data must be pd.DataFrame or Iterator[pd.DataFrame], got {type(data)}"
+                )
 
     finally:
-        if conn:
+        for conn in connections:
             conn.close()
-            logger.info("PostgreSQL connection closed")
+        if connections:
+            logger.info(f"Closed {len(connections)} PostgreSQL connections")
 
 
-def _upsert_single_dataframe(conn: PgConnection, df: pd.DataFrame) -> None:
+def _upsert_single_dataframe(
+    connections: list[PgConnection],
+    executor: ThreadPoolExecutor,
+    df: pd.DataFrame,
+) -> None:
     """Upsert a single DataFrame into the database.
 
+    Each dimension upsert works on its own shallow copy of ``df`` (sharing
+    the column data), so the threads never add columns to the same frame;
+    the resulting ID columns are copied back once all of them finish. The
+    fact table is loaded on the first connection.
+
     Args:
-        conn: PostgreSQL connection.
+        connections: One PostgreSQL connection per entry in ``DIMENSION_UPSERTS``.
+        executor: Thread pool running the dimension upserts.
         df: DataFrame to upsert.
     """
     logger.info(f"Upserting single DataFrame with {len(df)} records")
 
-    # Upsert dimensions (in order)
-    df = upsert_dimension_customer(conn, df)
-    df = upsert_dimension_product(conn, df)
-    df = upsert_dimension_date(conn, df)
+    # Upsert dimensions in parallel
+    futures = [
+        executor.submit(upsert, conn, df.copy(deep=False))
+        for (upsert, _), conn in zip(DIMENSION_UPSERTS, connections, strict=True)
+    ]
+    for (_, id_columns), future in zip(DIMENSION_UPSERTS, futures, strict=True):
+        result = future.result()
+        for column in id_columns:
+            df[column] = result[column]
 
     # Upsert fact table
-    upsert_fact_sales(conn, df)
+    upsert_fact_sales(connections[0], df)
 
     logger.info("Single DataFrame upsert complete")
 
 
 def _upsert_chunked_dataframes(
-    conn: PgConnection,
+    connections: list[PgConnection],
+    executor: ThreadPoolExecutor,
     df_iterator: Iterator[pd.DataFrame],
 ) -> None:
     """Upsert chunked DataFrames into the database.
 
     Args:
-        conn: PostgreSQL connection.
+        connections: One PostgreSQL connection per entry in ``DIMENSION_UPSERTS``.
+        executor: Thread pool running the dimension upserts.
         df_iterator: Iterator yielding DataFrames.
     """
     logger.info("Starting chunked upsert")
@@ -456,7 +670,7 @@ def _upsert_chunked_dataframes(
         chunk_num += 1
         logger.info(f"Upserting chunk {chunk_num} with {len(chunk_df)} records")
 
-        _upsert_single_dataframe(conn, chunk_df)
+        _upsert_single_dataframe(connections, executor, chunk_df)
 
         logger.info(f"Chunk {chunk_num} upsert complete")
 
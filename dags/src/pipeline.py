@@ -5,13 +5,17 @@ ingestion, validation, transformation, and loading into PostgreSQL.
 """
 
 import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pandas as pd
+import pyarrow as pa
 from minio import Minio
 from minio.error import S3Error
 
 from dags.src.ingestion.minio_client import (
     BUCKET_NAME,
+    PARQUET_COMPRESSION,
     get_minio_client,
     get_object_size,
     get_raw_data,
@@ -54,23 +58,28 @@ def _process_chunked_data(
         if not invalid_df.empty:
             invalid_chunks.append(invalid_df)
 
-    # Quarantine all invalid records
-    if invalid_chunks:
-        combined_invalid = pd.concat(invalid_chunks, ignore_index=True)
-        logger.warning(f"Found {len(combined_invalid)} invalid records across all chunks")
-        save_invalid_data_to_quarantine(minio_client, combined_invalid, file_key)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Quarantine all invalid records while the valid ones are loaded
+        quarantine = None
+        if invalid_chunks:
+            combined_invalid = pd.concat(invalid_chunks, ignore_index=True)
+            logger.warning(f"Found {len(combined_invalid)} invalid records across all chunks")
+            quarantine = executor.submit(
+                save_invalid_data_to_quarantine, minio_client, combined_invalid, file_key
+            )
 
-    # Transform valid chunks
-    logger.info("Transforming valid data chunks")
-    transformed_chunks = []
-    for valid_chunk in valid_chunks:
-        transformed_chunk = transform_sales_data(valid_chunk)
-        transformed_chunks.append(transformed_chunk)
+        # Transform valid chunks
+        logger.info("Transforming valid data chunks")
+        transformed_chunks = []
+        for valid_chunk in valid_chunks:
+            transformed_chunk = transform_sales_data(valid_chunk)
+            transformed_chunks.append(transformed_chunk)
 
-    # Load transformed data
-    logger.info("Loading transformed data to PostgreSQL")
-    for transformed_chunk in transformed_chunks:
-        upsert_data(vault_client, transformed_chunk)
+        # Load transformed data over one set of connections for all chunks
+        logger.info("Loading transformed data to PostgreSQL")
+        upsert_data(vault_client, iter(transformed_chunks))
+
+        _wait_for_quarantine(quarantine)
 
 
 def _process_single_dataframe(
@@ -93,23 +102,44 @@ def _process_single_dataframe(
         ValueError: If no valid records to process.
         Exception: If processing fails.
     """
-    # Quarantine invalid records
-    if not invalid_df.empty:
-        logger.warning(f"Found {len(invalid_df)} invalid records")
-        save_invalid_data_to_quarantine(minio_client, invalid_df, file_key)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Quarantine invalid records while the valid ones are loaded
+        quarantine = None
+        if not invalid_df.empty:
+            logger.warning(f"Found {len(invalid_df)} invalid records")
+            quarantine = executor.submit(
+                save_invalid_data_to_quarantine, minio_client, invalid_df, file_key
+            )
+
+        # Check if we have valid data to process
+        if valid_df.empty:
+            logger.warning("No valid records to process")
+            _wait_for_quarantine(quarantine)
+            raise ValueError(f"All records in {file_key} failed validation. Check quarantine.")
+
+        # Transform valid data
+        logger.info(f"Transforming {len(valid_df)} valid records")
+        transformed_df = transform_sales_data(valid_df)
 
-    # Check if we have valid data to process
-    if valid_df.empty:
-        logger.warning("No valid records to process")
-        raise ValueError(f"All records in {file_key} failed validation. Check quarantine.")
+        # Load into PostgreSQL
+        logger.info("Loading transformed data to PostgreSQL")
+        upsert_data(vault_client, transformed_df)
 
-    # Transform valid data
-    logger.info(f"Transforming {len(valid_df)} valid records")
-    transformed_df = transform_sales_data(valid_df)
+        _wait_for_quarantine(quarantine)
+
+
+def _wait_for_quarantine(quarantine: Future | None) -> None:
+    """Wait for a background quarantine upload and re-raise its error.
+
+    Args:
+        quarantine: Future returned when the upload was submitted, or None
+            if there was nothing to quarantine.
 
-    # Load into PostgreSQL
-    logger.info("Loading transformed data to PostgreSQL")
-    upsert_data(vault_client, transformed_df)
+    Raises:
+        S3Error: If the quarantine upload failed.
+    """
+    if quarantine is not None:
+        quarantine.result()
 
 
 def save_invalid_data_to_quarantine(
@@ -117,7 +147,12 @@ def save_invalid_data_to_quarantine(
     invalid_df: pd.DataFrame,
     original_file_key: str,
 ) -> None:
-    """Save invalid records to quarantine prefix in MinIO.
+    """Save invalid records to quarantine prefix in MinIO as Parquet.
+
+    Records are written under the original base name with a ``.parquet``
+    extension, compressed like the processed/ archive. Object columns are
+    written as strings, since invalid chunks concatenated together can hold
+    values of different types in one column.
 
     Args:
         minio_client: Initialized MinIO client.
@@ -126,6 +161,7 @@ def save_invalid_data_to_quarantine(
 
     Raises:
         S3Error: If upload to quarantine fails.
+        pa.ArrowException: If the records cannot be encoded as Parquet.
     """
     if invalid_df.empty:
         logger.info("No invalid records to quarantine")
@@ -134,20 +170,24 @@ def save_invalid_data_to_quarantine(
     try:
         # Extract filename and create quarantine key
         filename = original_file_key.replace("raw/", "")
-        quarantine_key = f"quarantine/{filename}"
-
-        # Convert DataFrame to CSV bytes
-        csv_buffer = io.BytesIO()
-        invalid_df.to_csv(csv_buffer, index=False)
-        csv_buffer.seek(0)
+        quarantine_key = f"quarantine/{os.path.splitext(filename)[0]}.parquet"
+
+        # Convert DataFrame to Parquet bytes, with mixed-type columns as text
+        object_columns = invalid_df.select_dtypes(include="object").columns
+        encodable = invalid_df.astype(dict.fromkeys(object_columns, "string"))
+        parquet_buffer = io.BytesIO()
+        encodable.to_parquet(
+            parquet_buffer, engine="pyarrow", compression=PARQUET_COMPRESSION, index=False
+        )
+        parquet_buffer.seek(0)
 
         # Upload to quarantine
         minio_client.put_object(
             BUCKET_NAME,
             quarantine_key,
-            csv_buffer,
-            length=csv_buffer.getbuffer().nbytes,
-            content_type="text/csv",
+            parquet_buffer,
+            length=parquet_buffer.getbuffer().nbytes,
+            content_type="application/vnd.apache.parquet",
         )
 
         logger.info(f"Quarantined {len(invalid_df)} invalid records to '{quarantine_key}'")
@@ -155,6 +195,9 @@ def save_invalid_data_to_quarantine(
     except S3Error as e:
         logger.error(f"Failed to save invalid data to quarantine: {str(e)}")
         raise
+    except pa.ArrowException as e:
+        logger.error(f"Failed to encode invalid data for quarantine: {str(e)}")
+        raise
 
 
 def run_pipeline(file_key: str) -> None:
@@ -164,8 +207,8 @@ def run_pipeline(file_key: str) -> None:
     1. Initialize Vault client and retrieve credentials
     2. Connect to MinIO and check file size
     3. Ingest data from MinIO (with chunking if needed)
-    4. Validate data against schema
-    5. Quarantine invalid records
+    4. Validate data against schema (skipped, with steps 5-7, for empty files)
+    5. Quarantine invalid records (concurrently with steps 6-7)
     6. Transform valid data
     7. Load transformed data into PostgreSQL
     8. Move processed file to processed/ prefix
@@ -194,22 +237,33 @@ def run_pipeline(file_key: str) -> None:
 
         # Step 4: Ingest data from MinIO
         logger.info("Ingesting data from MinIO")
-        raw_data = get_raw_data(minio_client, file_key)
+        raw_data = get_raw_data(minio_client, file_key, size=file_size)
 
-        # Step 5: Validate data
-        logger.info("Validating data against schema")
-        validation_result = validate_data(raw_data, SalesRecord)
-
-        # Step 6-8: Process validated data
-        if isinstance(raw_data, type(iter([]))):
-            _process_chunked_data(validation_result, vault_client, minio_client, file_key)
+        if isinstance(raw_data, pd.DataFrame) and raw_data.empty:
+            # Nothing to validate or load; the empty file is still archived
+            logger.warning(f"No records in {file_key}, skipping validation and loading")
         else:
-            valid_df, invalid_df = validation_result
-            _process_single_dataframe(valid_df, invalid_df, vault_client, minio_client, file_key)
+            # Step 5: Validate data
+            logger.info("Validating data against schema")
+            validation_result = validate_data(raw_data, SalesRecord)
+
+            # Step 6-8: Process validated data
+            if not isinstance(raw_data, pd.DataFrame):
+                _process_chunked_data(validation_result, vault_client, minio_client, file_key)
+            else:
+                valid_df, invalid_df = validation_result
+                _process_single_dataframe(
+                    valid_df, invalid_df, vault_client, minio_client, file_key
+                )
 
         # Step 9: Move file to processed/
         logger.info("Moving file to processed prefix")
-        destination_key = move_processed_file(minio_client, file_key)
+        # Archive from the frame already in memory; chunked reads were consumed
+        # and have to be read again, reusing the size fetched in step 3
+        archive_data = raw_data if isinstance(raw_data, pd.DataFrame) else None
+        destination_key = move_processed_file(
+            minio_client, file_key, data=archive_data, size=file_size
+        )
         logger.info(f"File moved to: {destination_key}")
 
         logger.info(f"ETL pipeline completed successfully for {file_key}")
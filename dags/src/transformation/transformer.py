@@ -6,7 +6,9 @@ PII anonymization, profit calculation, and data type conversions.
 
 import hashlib
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 
 from dags.src.utils.helpers import setup_logger
@@ -54,8 +56,9 @@ def _transform_single_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info(f"Starting transformation of {len(df)} records")
 
-    # Create a copy to avoid modifying original
-    transformed_df = df.copy()
+    # Every step assigns whole new columns rather than writing into existing
+    # arrays, so a shallow copy is enough to leave the caller's frame untouched
+    transformed_df = df.copy(deep=False)
 
     # PII Anonymization
     transformed_df = _anonymize_pii(transformed_df)
@@ -108,6 +111,11 @@ def _anonymize_pii(df: pd.DataFrame) -> pd.DataFrame:
     - Redact phone numbers (keep last 4 digits)
     - Redact addresses (keep only city/state)
 
+    The raw PII columns are dropped together at the end, so the frame is
+    rebuilt once rather than once per column. Phone redaction runs as Arrow
+    kernels that release the GIL, so it overlaps with email hashing on a
+    worker thread.
+
     Args:
         df: DataFrame with PII columns.
 
@@ -116,66 +124,78 @@ def _anonymize_pii(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.info("Anonymizing PII fields")
 
-    # Hash email addresses
-    if "customer_email" in df.columns:
-        df["customer_email_hash"] = df["customer_email"].apply(_hash_email)
-        df = df.drop(columns=["customer_email"])
+    pii_columns = []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Redact phone numbers in the background
+        redacted_phones = None
+        if "customer_phone" in df.columns:
+            redacted_phones = executor.submit(_redact_phones, df["customer_phone"])
 
-    # Redact phone numbers
-    if "customer_phone" in df.columns:
-        df["customer_phone_redacted"] = df["customer_phone"].apply(_redact_phone)
-        df = df.drop(columns=["customer_phone"])
+        # Hash email addresses
+        if "customer_email" in df.columns:
+            df["customer_email_hash"] = _hash_emails(df["customer_email"])
+            pii_columns.append("customer_email")
+
+        if redacted_phones is not None:
+            df["customer_phone_redacted"] = redacted_phones.result()
+            pii_columns.append("customer_phone")
 
     # Redact addresses
     if "customer_address" in df.columns:
-        df["customer_address_redacted"] = df["customer_address"].apply(_redact_address)
-        df = df.drop(columns=["customer_address"])
+        df["customer_address_redacted"] = _redact_addresses(df["customer_address"])
+        pii_columns.append("customer_address")
 
-    return df
+    return df.drop(columns=pii_columns) if pii_columns else df
 
 
-def _hash_email(email: str) -> str:
-    """Hash email address using SHA-256.
+def _hash_emails(emails: pd.Series) -> np.ndarray:
+    """Hash email addresses using SHA-256.
+
+    Customers repeat across orders, so each distinct address is hashed once
+    and the digests are spread back over the rows by their factorized codes.
 
     Args:
-        email: Email address to hash.
+        emails: Email addresses to hash.
 
     Returns:
-        SHA-256 hash of the email.
+        Object array of hex SHA-256 digests aligned with ``emails``.
     """
-    return hashlib.sha256(email.encode()).hexdigest()
+    codes, uniques = pd.factorize(emails, use_na_sentinel=False)
+    sha256 = hashlib.sha256
+    digests = np.array([sha256(email.encode()).hexdigest() for email in uniques], dtype=object)
+    return digests[codes]
+
 
+def _redact_phones(phones: pd.Series) -> pd.Series:
+    """Redact phone numbers, keeping only the last 4 digits.
 
-def _redact_phone(phone: str) -> str:
-    """Redact phone number, keeping only last 4 digits.
+    Runs as Arrow string kernels over the whole column rather than per value.
 
     Args:
-        phone: Phone number to redact.
+        phones: Phone numbers to redact.
 
     Returns:
-        Redacted phone number (e.g., "***-***-1234").
+        Redacted phone numbers (e.g., "***-***-1234"), or "***-***-****" when
+        fewer than 4 digits are present.
     """
-    # Extract digits only
-    digits = "".join(filter(str.isdigit, phone))
-
-    if len(digits) >= 4:
-        return f"***-***-{digits[-4:]}"
-    else:
-        return "***-***-****"
+    # Strip everything but the digits, then keep the last four
+    last_four = phones.astype("string[pyarrow]").str.replace(r"\D+", "", regex=True).str[-4:]
+    return ("***-***-" + last_four).where(last_four.str.len() == 4, "***-***-****")
 
 
-def _redact_address(address: str) -> str:
-    """Redact address, keeping only general location info.
+def _redact_addresses(addresses: pd.Series) -> pd.Series:
+    """Redact addresses, keeping only general location info.
 
     Args:
-        address: Address to redact.
+        addresses: Addresses to redact.
 
     Returns:
-        Redacted address pattern with asterisks.
+        Redacted address pattern with asterisks for every row.
     """
     # Simple redaction: return asterisk pattern
     # In production, might extract city/state using regex
-    return "*** **** **"
+    return pd.Series("*** **** **", index=addresses.index, dtype=object)
 
 
 def _calculate_profit(df: pd.DataFrame) -> pd.DataFrame:
@@ -192,7 +212,13 @@ def _calculate_profit(df: pd.DataFrame) -> pd.DataFrame:
     logger.info("Calculating profit")
 
     if "discounted_price" in df.columns and "original_price" in df.columns:
-        df["profit"] = df["discounted_price"] - (df["original_price"] * 0.6)
+        # Plain arrays skip index alignment, which dominates on small chunks
+        discounted = df["discounted_price"].to_numpy(dtype="float64")
+        original = df["original_price"].to_numpy(dtype="float64")
+        # Subtract into the cost buffer so only one new array is allocated
+        profit = original * 0.6
+        np.subtract(discounted, profit, out=profit)
+        df["profit"] = profit
     else:
         logger.warning("Cannot calculate profit: missing price columns")
 
@@ -234,6 +260,6 @@ def _round_monetary_values(df: pd.DataFrame) -> pd.DataFrame:
 
     for col in monetary_columns:
         if col in df.columns:
-            df[col] = df[col].round(2)
+            df[col] = np.round(df[col].to_numpy(dtype="float64"), 2)
 
     return df
@@ -1,15 +1,23 @@
-"""Utility functions for logging and Vault client initialization.
+"""Utility functions for logging, caching and Vault client initialization.
 
-This module provides centralized logging configuration and Vault client setup
-for the Mini Data Platform ETL pipeline.
+This module provides centralized logging configuration, a time-bounded cache
+for secrets, and Vault client setup for the Mini Data Platform ETL pipeline.
 """
 
+import functools
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from logging.handlers import RotatingFileHandler
+from typing import Any
 
 import hvac
 
+CREDENTIAL_CACHE_TTL = 300  # Seconds before credentials are re-read from Vault
+
 
 def setup_logger(
     logger_name: str,
@@ -36,10 +44,6 @@ def setup_logger(
     Raises:
         OSError: If log directory cannot be created.
     """
-    # Create logs directory if it doesn't exist
-    log_dir = os.path.dirname(log_file_path)
-    os.makedirs(log_dir, exist_ok=True)
-
     # Create logger
     logger = logging.getLogger(logger_name)
     logger.setLevel(level)
@@ -48,6 +52,10 @@ def setup_logger(
     if logger.handlers:
         return logger
 
+    # Create logs directory if it doesn't exist
+    log_dir = os.path.dirname(log_file_path)
+    os.makedirs(log_dir, exist_ok=True)
+
     # Create formatters
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -77,6 +85,52 @@ def setup_logger(
     return logger
 
 
+def ttl_cache(ttl: float, maxsize: int = 8) -> Callable[[Callable], Callable]:
+    """Cache a function's results per positional arguments for ``ttl`` seconds.
+
+    Arguments are matched by identity rather than equality, so unhashable
+    objects such as client instances can be used; cached entries hold a
+    reference to their arguments, so an identity is never reused while cached.
+    Exceptions are not cached. Once ``maxsize`` entries are held the least
+    recently used one is evicted. The wrapped function exposes
+    ``cache_clear()`` like ``functools.lru_cache``.
+
+    Args:
+        ttl: Seconds a cached result stays valid.
+        maxsize: Maximum number of cached argument combinations (default: 8).
+
+    Returns:
+        Decorator applying the cache.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache: OrderedDict[tuple[int, ...], tuple[float, tuple, Any]] = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key = tuple(map(id, args))
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return entry[2]
+
+            value = func(*args)
+
+            with lock:
+                cache[key] = (time.monotonic() + ttl, args, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
 def get_vault_client(
     vault_url: str | None = None,
     vault_token: str | None = None,
@@ -5,12 +5,46 @@ DAG task success and failure events.
 """
 
 import logging
+from string import Template
 from typing import Any
 
 from airflow.utils.email import send_email
 
 logger = logging.getLogger(__name__)
 
+# Email bodies are parsed once at import; each notification only substitutes values
+_SUCCESS_TEMPLATE = Template("""
+    <html>
+      <body>
+        <h2>Task Execution Successful</h2>
+        <ul>
+          <li><strong>DAG:</strong> $dag_id</li>
+          <li><strong>Task:</strong> $task_id</li>
+          <li><strong>Execution Date:</strong> $execution_date</li>
+          <li><strong>Status:</strong> <span style="color: green;">SUCCESS</span></li>
+        </ul>
+        <p>The task completed successfully without errors.</p>
+      </body>
+    </html>
+    """)
+
+_FAILURE_TEMPLATE = Template("""
+    <html>
+      <body>
+        <h2>Task Execution Failed</h2>
+        <ul>
+          <li><strong>DAG:</strong> $dag_id</li>
+          <li><strong>Task:</strong> $task_id</li>
+          <li><strong>Execution Date:</strong> $execution_date</li>
+          <li><strong>Status:</strong> <span style="color: red;">FAILURE</span></li>
+        </ul>
+        <h3>Exception Details:</h3>
+        <pre>$exception</pre>
+        <p><a href="$log_url">View Task Logs</a></p>
+      </body>
+    </html>
+    """)
+
 
 def send_success_notification(context: dict[str, Any]) -> None:
     """Send email notification on DAG task success.
@@ -33,20 +67,11 @@ def send_success_notification(context: dict[str, Any]) -> None:
     execution_date = execution_date_obj.isoformat() if execution_date_obj else "Unknown Date"
 
     subject = f"Success: {dag_id} - {task_id}"
-    html_content = f"""
-    <html>
-      <body>
-        <h2>Task Execution Successful</h2>
-        <ul>
-          <li><strong>DAG:</strong> {dag_id}</li>
-          <li><strong>Task:</strong> {task_id}</li>
-          <li><strong>Execution Date:</strong> {execution_date}</li>
-          <li><strong>Status:</strong> <span style="color: green;">SUCCESS</span></li>
-        </ul>
-        <p>The task completed successfully without errors.</p>
-      </body>
-    </html>
-    """
+    html_content = _SUCCESS_TEMPLATE.substitute(
+        dag_id=dag_id,
+        task_id=task_id,
+        execution_date=execution_date,
+    )
 
     try:
         # Send email using Airflow's configured SMTP connection
@@ -84,22 +109,13 @@ def send_failure_notification(context: dict[str, Any]) -> None:
     log_url = task_instance.log_url if task_instance else "#"
 
     subject = f"Failure: {dag_id} - {task_id}"
-    html_content = f"""
-    <html>
-      <body>
-        <h2>Task Execution Failed</h2>
-        <ul>
-          <li><strong>DAG:</strong> {dag_id}</li>
-          <li><strong>Task:</strong> {task_id}</li>
-          <li><strong>Execution Date:</strong> {execution_date}</li>
-          <li><strong>Status:</strong> <span style="color: red;">FAILURE</span></li>
-        </ul>
-        <h3>Exception Details:</h3>
-        <pre>{exception}</pre>
-        <p><a href="{log_url}">View Task Logs</a></p>
-      </body>
-    </html>
-    """
+    html_content = _FAILURE_TEMPLATE.substitute(
+        dag_id=dag_id,
+        task_id=task_id,
+        execution_date=execution_date,
+        exception=exception,
+        log_url=log_url,
+    )
 
     try:
         # Send email using Airflow's configured SMTP connection
@@ -4,10 +4,12 @@ This module validates incoming data against the Pydantic schema and
 separates valid records from invalid ones for quarantine.
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any
 
 import pandas as pd
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from dags.src.utils.helpers import setup_logger
 
@@ -16,7 +18,7 @@ logger = setup_logger("validation", "logs/validation.log")
 
 
 def validate_data(
-    data: pd.DataFrame | Iterator[pd.DataFrame],
+    data: pd.DataFrame | Iterable[pd.DataFrame],
     schema: type[BaseModel],
 ) -> tuple[pd.DataFrame, pd.DataFrame] | Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
     """Validate DataFrame rows against a Pydantic schema.
@@ -24,25 +26,27 @@ def validate_data(
     Validates each row in the DataFrame against the provided Pydantic schema.
     Returns separate DataFrames for valid and invalid records.
 
-    For chunked input (Iterator of DataFrames), returns an iterator of
-    (valid_df, invalid_df) tuples.
+    For chunked input (any iterable of DataFrames, such as a chunked reader or
+    a list of frames), returns an iterator of (valid_df, invalid_df) tuples.
+    Chunks are validated lazily as the result is consumed, so they never need
+    to be concatenated first.
 
     Args:
-        data: Single DataFrame or iterator of DataFrames to validate.
+        data: Single DataFrame or iterable of DataFrames to validate.
         schema: Pydantic BaseModel schema for validation.
 
     Returns:
         Tuple of (valid_df, invalid_df) or iterator of such tuples.
 
     Raises:
-        TypeError: If data is not a DataFrame or Iterator of DataFrames.
+        TypeError: If data is not a DataFrame or Iterable of DataFrames.
     """
     if isinstance(data, pd.DataFrame):
         return _validate_single_dataframe(data, schema)
-    elif isinstance(data, Iterator):
+    elif isinstance(data, Iterable) and not isinstance(data, (str, bytes)):
         return _validate_chunked_dataframes(data, schema)
     else:
-        raise TypeError(f"Data must be pd.DataFrame or Iterator[pd.DataFrame], got {type(data)}")
+        raise TypeError(f"Data must be pd.DataFrame or Iterable[pd.DataFrame], got {type(data)}")
 
 
 def _validate_single_dataframe(
@@ -51,6 +55,11 @@ def _validate_single_dataframe(
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Validate a single DataFrame against schema.
 
+    All rows are validated in one call into pydantic-core. When some rows
+    fail, the failing positions are read from the error locations and the
+    remaining rows are validated again in a second batch. Unexpected errors
+    fall back to validating row by row.
+
     Args:
         df: DataFrame to validate.
         schema: Pydantic BaseModel schema for validation.
@@ -58,16 +67,135 @@ def _validate_single_dataframe(
     Returns:
         Tuple of (valid_df, invalid_df).
     """
-    valid_records = []
+    logger.info(f"Starting validation of {len(df)} records")
+
+    try:
+        valid_records, invalid_records = _validate_batch(df, schema)
+    except Exception as e:
+        logger.error(f"Batch validation failed, validating row by row: {str(e)}")
+        valid_records, invalid_records = _validate_rows(df, schema)
+
+    # Create result DataFrames
+    valid_df = pd.DataFrame(valid_records) if valid_records else pd.DataFrame()
+    invalid_df = pd.DataFrame(invalid_records) if invalid_records else pd.DataFrame()
+
+    # Convert date columns back to datetime64 (Pydantic converts Timestamps to date objects)
+    if len(valid_df) > 0:
+        date_columns = ["order_date", "delivery_date", "data_collected_at"]
+        for col in date_columns:
+            if col in valid_df.columns:
+                valid_df[col] = pd.to_datetime(valid_df[col])
+
+    # Log results
+    logger.info(
+        f"Validation complete: {len(valid_df)} valid records, {len(invalid_df)} invalid records"
+    )
+
+    if len(invalid_df) > 0:
+        logger.warning("Invalid records will be quarantined")
+
+    return valid_df, invalid_df
+
+
+def _to_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Convert DataFrame rows to dicts of native Python values.
+
+    Each column is converted to a list once and the lists are zipped into
+    rows, avoiding a Series per row. Missing values in nullable columns
+    become None, as with ``DataFrame.to_dict(orient="records")``.
+
+    Args:
+        df: DataFrame to convert.
+
+    Returns:
+        One dict per row, keyed by column name.
+    """
+    columns = df.columns.tolist()
+    values = []
+    for column in columns:
+        series = df[column]
+        if getattr(series.dtype, "na_value", None) is pd.NA:
+            values.append(series.to_numpy(dtype=object, na_value=None).tolist())
+        else:
+            values.append(series.tolist())
+    return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
+
+
+@lru_cache(maxsize=8)
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Return the list validator for ``schema``, built once per schema.
+
+    Args:
+        schema: Pydantic BaseModel schema for validation.
+
+    Returns:
+        TypeAdapter validating a list of ``schema`` records.
+    """
+    return TypeAdapter(list[schema])
+
+
+def _validate_batch(
+    df: pd.DataFrame,
+    schema: type[BaseModel],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Validate all rows of a DataFrame with a single list validator.
+
+    Args:
+        df: DataFrame to validate.
+        schema: Pydantic BaseModel schema for validation.
+
+    Returns:
+        Tuple of (valid_records, invalid_records) as lists of dicts.
+    """
+    adapter = _list_adapter(schema)
+    records = _to_records(df)
     invalid_records = []
-    validation_errors = []
 
-    logger.info(f"Starting validation of {len(df)} records")
+    try:
+        validated = adapter.validate_python(records)
+    except ValidationError as e:
+        # Error locations start with the list position of the failing row
+        row_errors: dict[int, list[str]] = {}
+        for err in e.errors():
+            position, field = err["loc"][0], err["loc"][1]
+            row_errors.setdefault(position, []).append(f"{field}: {err['msg']}")
+
+        for position, messages in row_errors.items():
+            idx = df.index[position]
+            error_details = "; ".join(messages)
+            logger.warning(f"Row {idx} validation failed: {error_details}")
+
+            invalid_record = records[position]
+            invalid_record["validation_error"] = error_details
+            invalid_record["row_index"] = idx
+            invalid_records.append(invalid_record)
+
+        validated = adapter.validate_python(
+            [record for position, record in enumerate(records) if position not in row_errors]
+        )
+
+    # mode='python' preserves datetime objects
+    return adapter.dump_python(validated, mode="python"), invalid_records
+
+
+def _validate_rows(
+    df: pd.DataFrame,
+    schema: type[BaseModel],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Validate DataFrame rows one at a time against schema.
 
-    for idx, row in df.iterrows():
+    Args:
+        df: DataFrame to validate.
+        schema: Pydantic BaseModel schema for validation.
+
+    Returns:
+        Tuple of (valid_records, invalid_records) as lists of dicts.
+    """
+    valid_records = []
+    invalid_records = []
+
+    for idx, record_dict in zip(df.index, _to_records(df), strict=True):
         try:
-            # Convert row to dict and validate
-            record_dict = row.to_dict()
             validated_record = schema(**record_dict)
 
             # Add validated record to valid list (mode='python' preserves datetime objects)
@@ -79,50 +207,30 @@ def _validate_single_dataframe(
             logger.warning(f"Row {idx} validation failed: {error_details}")
 
             # Add to invalid records with error details
-            invalid_record = row.to_dict()
+            invalid_record = record_dict
             invalid_record["validation_error"] = error_details
             invalid_record["row_index"] = idx
             invalid_records.append(invalid_record)
-            validation_errors.append(error_details)
 
         except Exception as e:
             # Catch unexpected errors
             logger.error(f"Unexpected error validating row {idx}: {str(e)}")
-            invalid_record = row.to_dict()
+            invalid_record = record_dict
             invalid_record["validation_error"] = f"Unexpected error: {str(e)}"
             invalid_record["row_index"] = idx
             invalid_records.append(invalid_record)
 
-    # Create result DataFrames
-    valid_df = pd.DataFrame(valid_records) if valid_records else pd.DataFrame()
-    invalid_df = pd.DataFrame(invalid_records) if invalid_records else pd.DataFrame()
-
-    # Convert date columns back to datetime64 (Pydantic converts Timestamps to date objects)
-    if len(valid_df) > 0:
-        date_columns = ["order_date", "delivery_date", "data_collected_at"]
-        for col in date_columns:
-            if col in valid_df.columns:
-                valid_df[col] = pd.to_datetime(valid_df[col])
-
-    # Log results
-    logger.info(
-        f"Validation complete: {len(valid_df)} valid records, {len(invalid_df)} invalid records"
-    )
-
-    if len(invalid_df) > 0:
-        logger.warning("Invalid records will be quarantined")
-
-    return valid_df, invalid_df
+    return valid_records, invalid_records
 
 
 def _validate_chunked_dataframes(
-    df_iterator: Iterator[pd.DataFrame],
+    df_iterator: Iterable[pd.DataFrame],
     schema: type[BaseModel],
 ) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
     """Validate chunked DataFrames against schema.
 
     Args:
-        df_iterator: Iterator yielding DataFrames.
+        df_iterator: Iterable yielding DataFrames.
         schema: Pydantic BaseModel schema for validation.
 
     Yields:
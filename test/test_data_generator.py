@@ -201,7 +201,7 @@ class TestDataGenerator(unittest.TestCase):
         ]
 
         # Set a fixed number of rows for predictable testing
-        num_rows = 50
+        num_rows = 3
 
         # Mock MinIO client
         mock_minio_client = MagicMock()
@@ -0,0 +1,162 @@
+"""Sales record payloads shared across test modules.
+
+Rows are built once at import time and exposed as read-only mappings, so
+tests can pass them straight to ``pd.DataFrame`` without rebuilding the
+dicts or re-parsing their timestamps. Ready-made CSV payloads for the
+pipeline live in ``tests/data`` and are loaded with ``load_csv_asset``.
+Binary COPY payloads sent to the stub cursors are read back with
+``decode_pgcopy_rows``, and ``FakePgConnection`` stands in for a psycopg2
+connection in the integration and e2e suites.
+"""
+
+import re
+import struct
+from collections import defaultdict
+from functools import lru_cache
+from itertools import count
+from pathlib import Path
+from types import MappingProxyType
+
+import pandas as pd
+
+DATA_DIR = Path(__file__).parent / "data"
+
+INVALID_SALES_ROW = MappingProxyType(
+    {
+        "order_id": "INV",  # Invalid - too short
+        "customer_name": "Invalid User",
+        "customer_email": "not-email",  # Invalid
+        "customer_phone": "123",
+        "customer_address": "Addr",
+        "product_title": "Product",
+        "product_rating": 10.0,  # Invalid
+        "discounted_price": -50.0,  # Invalid
+        "original_price": 100.0,
+        "discount_percentage": 200,  # Invalid
+        "is_best_seller": True,
+        "delivery_date": pd.Timestamp("2025-10-01"),
+        "data_collected_at": pd.Timestamp("2025-10-01"),
+        "product_category": "Test",
+        "quantity": 0,  # Invalid
+        "order_date": pd.Timestamp("2025-10-01"),
+    }
+)
+
+
+@lru_cache
+def load_csv_asset(name: str) -> bytes:
+    """Return the raw bytes of a CSV payload checked into ``tests/data``.
+
+    Args:
+        name: File name within ``tests/data`` (e.g. ``"mixed.csv"``).
+
+    Returns:
+        File contents, read from disk once per process.
+    """
+    return (DATA_DIR / name).read_bytes()
+
+
+def decode_pgcopy_rows(payload: bytes) -> list[list[bytes | None]]:
+    """Split a binary COPY payload into rows of raw field bytes (None for NULL)."""
+    assert payload.startswith(b"PGCOPY\n\xff\r\n\x00")
+    offset, rows = 19, []
+    while (field_count := struct.unpack_from(">h", payload, offset)[0]) != -1:
+        offset += 2
+        row = []
+        for _ in range(field_count):
+            (length,) = struct.unpack_from(">i", payload, offset)
+            offset += 4
+            row.append(None if length == -1 else payload[offset : offset + length])
+            offset += max(length, 0)
+        rows.append(row)
+    assert offset + 2 == len(payload)
+    return rows
+
+
+_TABLE_RE = re.compile(r"\b(?:INTO|FROM)\s+(\w+)", re.IGNORECASE)
+
+# Positions of the natural key within each dimension's VALUES tuple
+_RETURNING_KEYS = {"dim_customer": (1,), "dim_product": (0, 2)}
+
+
+class FakePgCursor:
+    """Cursor stub handing out per-table surrogate IDs and fixed date mappings.
+
+    ``execute`` selects the connection's ID queue for the table named in the
+    statement. Batched ``RETURNING`` inserts answer with ``(id, *natural_key)``
+    rows built from the tuples passed through ``mogrify`` or staged with
+    ``COPY``; date lookups return the fixed mapping.
+    """
+
+    def __init__(self, connection, date_rows):
+        self.connection = connection
+        self._date_rows = date_rows
+        self._next_fetch = connection.id_queues[None]
+        self._pending = []
+        self._rows = []
+
+    def mogrify(self, template, args):
+        self._pending.append(args)
+        return template
+
+    def execute(self, sql, params=None):
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+        match = _TABLE_RE.search(sql)
+        table = match.group(1) if match else None
+        self._next_fetch = self.connection.id_queues[table]
+
+        if table in _RETURNING_KEYS and "RETURNING" in sql:
+            keys = _RETURNING_KEYS[table]
+            self._rows = [
+                (next(self._next_fetch), *(args[i] for i in keys)) for args in self._pending
+            ]
+        elif sql.lstrip().upper().startswith("SELECT"):
+            self._rows = self._date_rows
+        else:
+            self._rows = []
+        self._pending = []
+
+    def fetchone(self):
+        return (next(self._next_fetch),)
+
+    def fetchall(self):
+        return self._rows
+
+    def copy_expert(self, sql, file, size=8192):
+        payload = file.read()
+        if "stg_dim_customer" in sql:
+            self._pending = [
+                tuple(None if field is None else field.decode() for field in row)
+                for row in decode_pgcopy_rows(payload)
+            ]
+
+    def close(self):
+        pass
+
+
+class FakePgConnection:
+    """psycopg2 connection stub handing out a fresh FakePgCursor per call.
+
+    Surrogate ID queues live on the connection, so IDs keep counting across
+    cursors, while concurrent dimension upserts sharing the stub never share
+    a cursor's pending rows.
+    """
+
+    encoding = "UTF8"
+
+    def __init__(self, date_rows):
+        self._date_rows = date_rows
+        self.id_queues = defaultdict(lambda: count(2))
+
+    def cursor(self):
+        return FakePgCursor(self, self._date_rows)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
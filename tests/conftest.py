@@ -1,44 +1,110 @@
 """Shared test fixtures for ETL pipeline testing."""
 
+import io
+from collections import namedtuple
 from datetime import date
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pandas as pd
 import pytest
 
+from dags.src.ingestion.minio_client import _connect_minio, get_minio_credentials
+from dags.src.loading.postgres_loader import get_postgres_credentials
 
-@pytest.fixture
-def mock_vault_client():
-    """Create a mock Vault client."""
-    mock_client = MagicMock()
-    mock_client.is_authenticated.return_value = True
-    mock_client.secrets.kv.v2.read_secret_version.return_value = {
+VAULT_TEST_SECRETS = {
+    "data": {
         "data": {
-            "data": {
-                "access_key": "test_access_key",
-                "secret_key": "test_secret_key",
-                "user": "test_user",
-                "password": "test_password",
-                "host": "localhost",
-                "port": "5432",
-                "dbname": "test_db",
-            }
+            "access_key": "test_access_key",
+            "secret_key": "test_secret_key",
+            "user": "test_user",
+            "password": "test_password",
+            "host": "localhost",
+            "port": "5432",
+            "dbname": "test_db",
         }
     }
-    return mock_client
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_caches():
+    """Drop cached credentials and MinIO clients so every test starts cold."""
+    yield
+    get_minio_credentials.cache_clear()
+    get_postgres_credentials.cache_clear()
+    _connect_minio.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def _session_vault_client():
+    """Build the Vault client mock once per session."""
+    return MagicMock()
 
 
 @pytest.fixture
-def mock_minio_client():
-    """Create a mock MinIO client."""
-    mock_client = MagicMock()
-    mock_client.bucket_exists.return_value = True
-    return mock_client
+def mock_vault_client(_session_vault_client):
+    """Create a mock Vault client.
+
+    The session-wide mock is configured for each test and reset afterwards,
+    so per-test overrides and recorded calls never leak between tests.
+    """
+    mock_client = _session_vault_client
+    mock_client.is_authenticated.return_value = True
+    mock_client.secrets.kv.v2.read_secret_version.return_value = VAULT_TEST_SECRETS
+    yield mock_client
+    mock_client.reset_mock(return_value=True, side_effect=True)
+
+
+MinioResponse = namedtuple("MinioResponse", ["read", "close", "release_conn"])
+MinioStat = namedtuple("MinioStat", ["size"])
+
+
+def _make_minio_object(csv_data: bytes) -> tuple[MinioResponse, MinioStat]:
+    """Build the ``get_object`` response and ``stat_object`` result for ``csv_data``.
+
+    The response is a single-use stream, like the real object download.
+    """
+    response = MinioResponse(
+        read=io.BytesIO(csv_data).read,
+        close=lambda: None,
+        release_conn=lambda: None,
+    )
+    return response, MinioStat(size=len(csv_data))
+
+
+@pytest.fixture(scope="session")
+def make_minio_object():
+    """Return the factory building a MinIO (response, stat) pair for CSV bytes."""
+    return _make_minio_object
 
 
 @pytest.fixture
+def mock_minio_client():
+    """Create a mock MinIO client.
+
+    Only the client methods the platform calls exist, each as a plain ``Mock``,
+    so a misspelled method fails the test instead of quietly returning a child mock.
+    """
+    return SimpleNamespace(
+        bucket_exists=Mock(return_value=True),
+        stat_object=Mock(),
+        get_object=Mock(),
+        list_objects=Mock(),
+        put_object=Mock(),
+        copy_object=Mock(),
+        remove_object=Mock(),
+        remove_objects=Mock(),
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_sales_data():
-    """Create sample valid sales data."""
+    """Create sample valid sales data.
+
+    Session-scoped and shared read-only; tests that modify the frame, directly
+    or through in-place loaders, use ``mutable_sales_data`` instead.
+    """
     return pd.DataFrame(
         [
             {
@@ -81,9 +147,12 @@ def sample_sales_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_invalid_data():
-    """Create sample invalid sales data."""
+    """Create sample invalid sales data.
+
+    Session-scoped and shared read-only, like ``sample_sales_data``.
+    """
     return pd.DataFrame(
         [
             {
@@ -108,6 +177,24 @@ def sample_invalid_data():
     )
 
 
+@pytest.fixture(scope="session")
+def sample_mixed_data(sample_sales_data, sample_invalid_data):
+    """Valid rows followed by the invalid row, with a fresh RangeIndex."""
+    return pd.concat([sample_sales_data, sample_invalid_data], ignore_index=True)
+
+
+@pytest.fixture
+def mutable_sales_data(sample_sales_data):
+    """Per-test copy of ``sample_sales_data`` that may be modified."""
+    return sample_sales_data.copy()
+
+
+@pytest.fixture
+def mutable_invalid_data(sample_invalid_data):
+    """Per-test copy of ``sample_invalid_data`` that may be modified."""
+    return sample_invalid_data.copy()
+
+
 @pytest.fixture
 def mock_postgres_connection():
     """Create a mock PostgreSQL connection."""
@@ -1,15 +1,48 @@
 """Shared fixtures for end-to-end tests."""
 
+import os
 from datetime import date
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import pytest
 
+from tests._fixtures import FakePgConnection, load_csv_asset
 
-@pytest.fixture
+
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to CSV bytes with pyarrow's CSV writer.
+
+    pyarrow's multithreaded CSV writer is much faster than ``DataFrame.to_csv``
+    on large frames and produces output that ``pd.read_csv`` parses identically.
+    """
+    sink = pa.BufferOutputStream()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+    return sink.getvalue().to_pybytes()
+
+
+@pytest.fixture(scope="package", autouse=True)
+def _stub_path_exists():
+    """Report every path as existing for the whole e2e package.
+
+    The loader only checks for the PostgreSQL CA certificate, which the
+    stubbed environment never provides. Installed once here instead of
+    being patched and unpatched around every pipeline run.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(os.path, "exists", lambda path: True)
+        yield
+
+
+@pytest.fixture(scope="session")
 def e2e_complete_dataset():
-    """Create complete realistic dataset for e2e testing."""
+    """Create complete realistic dataset for e2e testing.
+
+    Session-scoped: the frame is built once and shared read-only by all e2e tests.
+    """
     return pd.DataFrame(
         [
             {
@@ -106,18 +139,80 @@ def e2e_complete_dataset():
     )
 
 
-@pytest.fixture
-def mock_e2e_environment():
-    """Create complete mock environment for e2e testing."""
-    mocks = {
-        "vault": MagicMock(),
-        "minio": MagicMock(),
-        "postgres": MagicMock(),
-    }
+@pytest.fixture(scope="session")
+def e2e_complete_csv(request, tmp_path_factory):
+    """Serialize the e2e dataset to CSV bytes once per test run.
+
+    Under pytest-xdist the payload is cached in the run's shared base temp
+    directory, so only the first worker builds and serializes the dataset
+    and the others read the bytes back. The atomic rename means a worker
+    never sees a partially written file.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        return _to_csv_bytes(request.getfixturevalue("e2e_complete_dataset"))
+
+    cache = tmp_path_factory.getbasetemp().parent / "e2e_complete.csv"
+    if cache.is_file():
+        return cache.read_bytes()
+
+    payload = _to_csv_bytes(request.getfixturevalue("e2e_complete_dataset"))
+    partial = cache.with_name(f"{cache.name}.{os.getpid()}")
+    partial.write_bytes(payload)
+    partial.replace(cache)
+    return payload
+
+
+@pytest.fixture(scope="session")
+def e2e_mixed_csv():
+    """CSV bytes with one valid and one invalid record."""
+    return load_csv_asset("mixed.csv")
+
 
-    # Vault mock
-    mocks["vault"].is_authenticated.return_value = True
-    mocks["vault"].secrets.kv.v2.read_secret_version.return_value = {
+@pytest.fixture(scope="session")
+def e2e_all_invalid_csv():
+    """CSV bytes containing only invalid records."""
+    return load_csv_asset("invalid_row.csv")
+
+
+@pytest.fixture(scope="session")
+def e2e_missing_columns_csv():
+    """CSV bytes missing most required columns."""
+    return b"order_id,customer_name\nABC123,Test"
+
+
+def _make_minio_mock(csv_bytes: bytes, make_minio_object) -> SimpleNamespace:
+    """Build a MinIO stub that serves ``csv_bytes`` for every key.
+
+    Every ``get_object`` call gets a fresh single-use stream, since chunked
+    reads download the raw object again when it is archived. Upload,
+    copy and remove are ``Mock`` objects so tests can assert on them.
+    """
+    stat = make_minio_object(csv_bytes)[1]
+    return SimpleNamespace(
+        bucket_exists=lambda bucket_name: True,
+        get_object=lambda *args, **kwargs: make_minio_object(csv_bytes)[0],
+        stat_object=lambda *args, **kwargs: stat,
+        put_object=Mock(),
+        copy_object=Mock(),
+        remove_object=Mock(),
+    )
+
+
+@pytest.fixture(scope="session")
+def make_minio_mock(make_minio_object):
+    """Return the factory building a MinIO stub preloaded with CSV bytes."""
+    return lambda csv_bytes: _make_minio_mock(csv_bytes, make_minio_object)
+
+
+@pytest.fixture(scope="session")
+def make_e2e_environment(make_minio_mock):
+    """Return a factory building a fresh stubbed vault/minio/postgres environment.
+
+    Vault and PostgreSQL are plain stubs since no test inspects their calls.
+    MinIO starts out serving an empty object; tests swap in their own payload
+    with ``make_minio_mock``.
+    """
+    secrets = {
         "data": {
             "data": {
                 "access_key": "e2e_access_key",
@@ -130,15 +225,7 @@ def mock_e2e_environment():
             }
         }
     }
-
-    # MinIO mock
-    mocks["minio"].bucket_exists.return_value = True
-
-    # PostgreSQL mock
-    mock_cursor = MagicMock()
-    mocks["postgres"].cursor.return_value = mock_cursor
-    mock_cursor.fetchone.return_value = (1,)
-    mock_cursor.fetchall.return_value = [
+    date_rows = [
         (1, date(2025, 10, 18)),
         (2, date(2025, 10, 19)),
         (3, date(2025, 10, 20)),
@@ -146,4 +233,23 @@ def mock_e2e_environment():
         (5, date(2025, 10, 22)),
     ]
 
-    return mocks
+    def _make():
+        vault = SimpleNamespace(
+            is_authenticated=lambda: True,
+            secrets=SimpleNamespace(
+                kv=SimpleNamespace(v2=SimpleNamespace(read_secret_version=lambda **kwargs: secrets))
+            ),
+        )
+        return SimpleNamespace(
+            vault=vault,
+            minio=make_minio_mock(b""),
+            postgres=FakePgConnection(date_rows),
+        )
+
+    return _make
+
+
+@pytest.fixture
+def mock_e2e_environment(make_e2e_environment):
+    """Create complete mock environment for e2e testing."""
+    return make_e2e_environment()
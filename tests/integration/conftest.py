@@ -1,14 +1,19 @@
 """Shared fixtures for integration tests."""
 
-import io
 from datetime import date
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
+from dags.src.ingestion import minio_client
+from dags.src.transformation.transformer import transform_sales_data
+from dags.src.utils.schemas import SalesRecord
+from dags.src.validation.validator import validate_data
+from tests._fixtures import FakePgConnection
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def integration_sales_data():
     """Create realistic sales data for integration testing."""
     return pd.DataFrame(
@@ -71,59 +76,60 @@ def integration_sales_data():
     )
 
 
-@pytest.fixture
-def mock_minio_with_csv_data(integration_sales_data):
-    """Create mock MinIO client with CSV data."""
-    mock_client = MagicMock()
-    mock_client.bucket_exists.return_value = True
+@pytest.fixture(scope="session")
+def integration_sales_csv(integration_sales_data):
+    """Serialize the integration dataset to CSV bytes once per session."""
+    return integration_sales_data.to_csv(index=False).encode()
+
+
+@pytest.fixture(scope="module")
+def validated_integration_data(integration_sales_data):
+    """Validate the integration dataset once per test module."""
+    return validate_data(integration_sales_data, SalesRecord)
+
+
+@pytest.fixture(scope="module")
+def transformed_integration_data(validated_integration_data):
+    """Transform the validated integration dataset once per test module."""
+    valid_df, _ = validated_integration_data
+    return transform_sales_data(valid_df)
 
-    # Mock CSV data as bytes
-    csv_buffer = io.BytesIO()
-    integration_sales_data.to_csv(csv_buffer, index=False)
-    csv_data = csv_buffer.getvalue()
 
-    mock_response = MagicMock()
-    mock_response.read.return_value = csv_data
-    mock_client.get_object.return_value = mock_response
+@pytest.fixture
+def patched_get_raw_data(monkeypatch, integration_sales_data):
+    """Make get_raw_data return the integration dataset without a CSV round-trip.
+
+    For tests that exercise validation rather than CSV parsing; the MinIO
+    download and ``pd.read_csv`` are skipped entirely.
+    """
+    monkeypatch.setattr(
+        minio_client,
+        "get_raw_data",
+        lambda *args, **kwargs: integration_sales_data.copy(),
+    )
 
-    # Mock object size
-    mock_stat = MagicMock()
-    mock_stat.size = len(csv_data)
-    mock_client.stat_object.return_value = mock_stat
 
-    return mock_client
+@pytest.fixture
+def mock_minio_with_csv_data(integration_sales_csv, make_minio_object):
+    """Create a MinIO stub serving the integration CSV data.
+
+    Ingestion only reads the object, so the stub exposes just those calls.
+    """
+    response, stat = make_minio_object(integration_sales_csv)
+    return SimpleNamespace(
+        bucket_exists=lambda bucket_name: True,
+        get_object=lambda *args, **kwargs: response,
+        stat_object=lambda *args, **kwargs: stat,
+    )
 
 
 @pytest.fixture
 def mock_postgres_with_transactions():
-    """Create mock PostgreSQL connection with transaction support."""
-    mock_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-
-    # Mock dimension ID returns
-    customer_id = 1
-    product_id = 1
-    date_id = 1
-
-    def mock_fetchone_side_effect(*args, **kwargs):
-        nonlocal customer_id, product_id, date_id
-        # Alternate between returning different IDs
-        if "customer" in str(args):
-            customer_id += 1
-            return (customer_id,)
-        elif "product" in str(args):
-            product_id += 1
-            return (product_id,)
-        else:
-            date_id += 1
-            return (date_id,)
-
-    mock_cursor.fetchone.side_effect = mock_fetchone_side_effect
-    mock_cursor.fetchall.return_value = [
-        (1, date(2025, 10, 15)),
-        (2, date(2025, 10, 16)),
-        (3, date(2025, 10, 14)),
-    ]
-
-    return mock_conn
+    """Create stub PostgreSQL connection with transaction support."""
+    return FakePgConnection(
+        [
+            (1, date(2025, 10, 15)),
+            (2, date(2025, 10, 16)),
+            (3, date(2025, 10, 14)),
+        ]
+    )
@@ -1,19 +1,21 @@
 """Integration tests for ingestion and validation components."""
 
-import io
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pandas as pd
+import pytest
 
-from dags.src.ingestion.minio_client import get_raw_data
+from dags.src.ingestion import minio_client
 from dags.src.utils.schemas import SalesRecord
 from dags.src.validation.validator import validate_data
+from tests._fixtures import INVALID_SALES_ROW
 
 
+@pytest.mark.usefixtures("patched_get_raw_data")
 def test_ingest_and_validate_valid_data(mock_minio_with_csv_data):
     """Test ingesting CSV from MinIO and validating valid data."""
     # Ingest data
-    df = get_raw_data(mock_minio_with_csv_data, "raw/test.csv")
+    df = minio_client.get_raw_data(mock_minio_with_csv_data, "raw/test.csv")
 
     # Validate
     valid_df, invalid_df = validate_data(df, SalesRecord)
@@ -24,36 +26,14 @@ def test_ingest_and_validate_valid_data(mock_minio_with_csv_data):
     assert all(valid_df.columns == df.columns)
 
 
+@pytest.mark.usefixtures("patched_get_raw_data")
 def test_ingest_and_validate_mixed_data(mock_minio_with_csv_data):
     """Test ingesting and validating data with both valid and invalid records."""
     # Get valid data first
-    df = get_raw_data(mock_minio_with_csv_data, "raw/test.csv")
+    df = minio_client.get_raw_data(mock_minio_with_csv_data, "raw/test.csv")
 
     # Add invalid record
-    invalid_row = pd.DataFrame(
-        [
-            {
-                "order_id": "SHORT",  # Invalid
-                "customer_name": "Test",
-                "customer_email": "not-an-email",  # Invalid
-                "customer_phone": "555",
-                "customer_address": "Address",
-                "product_title": "Product",
-                "product_rating": 6.0,  # Invalid
-                "discounted_price": -10.0,  # Invalid
-                "original_price": 100.0,
-                "discount_percentage": 200,  # Invalid
-                "is_best_seller": True,
-                "delivery_date": pd.Timestamp("2025-10-01"),
-                "data_collected_at": pd.Timestamp("2025-10-01"),
-                "product_category": "Test",
-                "quantity": 0,  # Invalid
-                "order_date": pd.Timestamp("2025-10-01"),
-            }
-        ]
-    )
-
-    mixed_df = pd.concat([df, invalid_row], ignore_index=True)
+    mixed_df = pd.DataFrame([*df.to_dict("records"), INVALID_SALES_ROW])
 
     # Validate
     valid_df, invalid_df = validate_data(mixed_df, SalesRecord)
@@ -64,28 +44,23 @@ def test_ingest_and_validate_mixed_data(mock_minio_with_csv_data):
     assert "validation_error" in invalid_df.columns
 
 
-def test_ingest_csv_with_missing_columns():
+def test_ingest_csv_with_missing_columns(make_minio_object):
     """Test validation fails gracefully with missing required columns."""
     # Create mock MinIO with incomplete CSV
     incomplete_df = pd.DataFrame(
         [{"order_id": "ABC123", "customer_name": "John"}]  # Missing required columns
     )
 
-    csv_buffer = io.BytesIO()
-    incomplete_df.to_csv(csv_buffer, index=False)
-    csv_data = csv_buffer.getvalue()
+    csv_data = incomplete_df.to_csv(index=False).encode("utf-8")
 
-    mock_client = MagicMock()
-    mock_response = MagicMock()
-    mock_response.read.return_value = csv_data
-    mock_client.get_object.return_value = mock_response
-
-    mock_stat = MagicMock()
-    mock_stat.size = len(csv_data)
-    mock_client.stat_object.return_value = mock_stat
+    response, stat = make_minio_object(csv_data)
+    mock_client = SimpleNamespace(
+        get_object=lambda *args, **kwargs: response,
+        stat_object=lambda *args, **kwargs: stat,
+    )
 
     # Ingest
-    df = get_raw_data(mock_client, "raw/incomplete.csv")
+    df = minio_client.get_raw_data(mock_client, "raw/incomplete.csv")
 
     # Validate - should handle missing columns
     valid_df, invalid_df = validate_data(df, SalesRecord)
@@ -98,7 +73,7 @@ def test_ingest_csv_with_missing_columns():
 def test_ingest_and_validate_preserves_data_types(mock_minio_with_csv_data):
     """Test that ingestion and validation preserve correct data types."""
     # Ingest
-    df = get_raw_data(mock_minio_with_csv_data, "raw/test.csv")
+    df = minio_client.get_raw_data(mock_minio_with_csv_data, "raw/test.csv")
 
     # Validate
     valid_df, _ = validate_data(df, SalesRecord)
@@ -1,22 +1,24 @@
 """Integration tests for validation and transformation components."""
 
+import numpy as np
 import pandas as pd
 
 from dags.src.transformation.transformer import transform_sales_data
 from dags.src.utils.schemas import SalesRecord
 from dags.src.validation.validator import validate_data
+from tests._fixtures import INVALID_SALES_ROW
 
 
-def test_validate_then_transform_valid_data(integration_sales_data):
+def test_validate_then_transform_valid_data(
+    validated_integration_data, transformed_integration_data
+):
     """Test validating and transforming valid sales data."""
-    # Validate
-    valid_df, invalid_df = validate_data(integration_sales_data, SalesRecord)
+    valid_df, invalid_df = validated_integration_data
 
     assert len(valid_df) == 3
     assert len(invalid_df) == 0
 
-    # Transform
-    transformed_df = transform_sales_data(valid_df)
+    transformed_df = transformed_integration_data
 
     # Verify transformations applied
     assert "customer_email_hash" in transformed_df.columns
@@ -25,69 +27,45 @@ def test_validate_then_transform_valid_data(integration_sales_data):
     assert "profit" in transformed_df.columns
 
     # Verify PII anonymization
-    assert all(transformed_df["customer_email_hash"].str.len() == 64)  # SHA-256 hash
+    email_hashes = transformed_df["customer_email_hash"].to_numpy(dtype="U")
+    assert (np.char.str_len(email_hashes) == 64).all()  # SHA-256 hash
     assert all(transformed_df["customer_phone_redacted"].str.startswith("***-***-"))  # Redacted phone
     assert all(transformed_df["customer_address_redacted"] == "*** **** **")
 
 
-def test_transform_maintains_valid_data_integrity(integration_sales_data):
+def test_transform_maintains_valid_data_integrity(
+    validated_integration_data, transformed_integration_data
+):
     """Test that transformation maintains data integrity for valid records."""
-    # Validate
-    valid_df, _ = validate_data(integration_sales_data, SalesRecord)
+    valid_df, _ = validated_integration_data
 
-    # Store original values
-    original_order_ids = valid_df["order_id"].tolist()
-    original_quantities = valid_df["quantity"].tolist()
-
-    # Transform
-    transformed_df = transform_sales_data(valid_df)
+    transformed_df = transformed_integration_data
 
     # Verify key fields unchanged
-    assert transformed_df["order_id"].tolist() == original_order_ids
-    assert transformed_df["quantity"].tolist() == original_quantities
+    for column in ("order_id", "quantity"):
+        pd.testing.assert_series_equal(
+            transformed_df[column].reset_index(drop=True),
+            valid_df[column].reset_index(drop=True),
+        )
 
 
-def test_transform_calculates_profit_correctly(integration_sales_data):
+def test_transform_calculates_profit_correctly(transformed_integration_data):
     """Test that profit calculation is correct after validation."""
-    # Validate
-    valid_df, _ = validate_data(integration_sales_data, SalesRecord)
-
-    # Transform
-    transformed_df = transform_sales_data(valid_df)
+    transformed_df = transformed_integration_data
 
     # Verify profit calculation (discounted_price - (original_price * 0.6))
-    for _, row in transformed_df.iterrows():
-        expected_profit = row["discounted_price"] - (row["original_price"] * 0.6)
-        assert abs(row["profit"] - expected_profit) < 0.01  # Allow for rounding
+    expected_profit = transformed_df["discounted_price"] - transformed_df["original_price"] * 0.6
+    np.testing.assert_allclose(
+        transformed_df["profit"].to_numpy(),
+        expected_profit.to_numpy(),
+        atol=0.01,  # Allow for rounding
+    )
 
 
 def test_validation_filters_invalid_before_transformation(integration_sales_data):
     """Test that invalid data is filtered out before transformation."""
     # Add invalid record
-    invalid_row = pd.DataFrame(
-        [
-            {
-                "order_id": "INV",
-                "customer_name": "Invalid User",
-                "customer_email": "not-valid",
-                "customer_phone": "123",
-                "customer_address": "Addr",
-                "product_title": "Product",
-                "product_rating": 10.0,
-                "discounted_price": -50.0,
-                "original_price": 100.0,
-                "discount_percentage": 150,
-                "is_best_seller": True,
-                "delivery_date": pd.Timestamp("2025-10-01"),
-                "data_collected_at": pd.Timestamp("2025-10-01"),
-                "product_category": "Test",
-                "quantity": -1,
-                "order_date": pd.Timestamp("2025-10-01"),
-            }
-        ]
-    )
-
-    mixed_data = pd.concat([integration_sales_data, invalid_row], ignore_index=True)
+    mixed_data = pd.DataFrame([*integration_sales_data.to_dict("records"), INVALID_SALES_ROW])
 
     # Validate
     valid_df, invalid_df = validate_data(mixed_data, SalesRecord)
@@ -103,13 +81,9 @@ def test_validation_filters_invalid_before_transformation(integration_sales_data
     assert "INV" not in transformed_df["order_id"].values
 
 
-def test_transform_preserves_column_count(integration_sales_data):
+def test_transform_preserves_column_count(transformed_integration_data):
     """Test that transformation adds expected new columns."""
-    # Validate
-    valid_df, _ = validate_data(integration_sales_data, SalesRecord)
-
-    # Transform
-    transformed_df = transform_sales_data(valid_df)
+    transformed_df = transformed_integration_data
     new_columns = set(transformed_df.columns)
 
     # New columns should be added
@@ -123,13 +97,9 @@ def test_transform_preserves_column_count(integration_sales_data):
     assert expected_new_columns.issubset(new_columns)
 
 
-def test_transformation_handles_edge_case_values(integration_sales_data):
+def test_transformation_handles_edge_case_values(transformed_integration_data):
     """Test transformation handles edge case values correctly."""
-    # Validate
-    valid_df, _ = validate_data(integration_sales_data, SalesRecord)
-
-    # Transform
-    transformed_df = transform_sales_data(valid_df)
+    transformed_df = transformed_integration_data
 
     # Check that all anonymized fields are not null
     assert transformed_df["customer_email_hash"].notna().all()
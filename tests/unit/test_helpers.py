@@ -1,22 +1,45 @@
 """Unit tests for utility helper functions."""
 
+import logging
 import os
+import uuid
 from unittest.mock import patch
 
 import hvac
 import pytest
 
-from dags.src.utils.helpers import get_vault_client, setup_logger
+from dags.src.utils import helpers
+from dags.src.utils.helpers import get_vault_client, setup_logger, ttl_cache
 
 
-def test_setup_logger_creates_logger():
+@pytest.fixture
+def unique_logger_name():
+    """Yield a fresh logger name and detach its handlers afterwards."""
+    name = f"test_logger_{uuid.uuid4().hex}"
+    yield name
+    logger = logging.getLogger(name)
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
+
+
+def test_setup_logger_creates_logger(unique_logger_name):
     """Test that logger is created with correct configuration."""
-    logger = setup_logger("test_logger", "logs/test.log")
+    logger = setup_logger(unique_logger_name, "logs/test.log")
 
-    assert logger.name == "test_logger"
+    assert logger.name == unique_logger_name
     assert len(logger.handlers) == 2  # File and console handlers
 
 
+def test_setup_logger_does_not_duplicate_handlers(unique_logger_name):
+    """Test that repeated setup returns the same logger without new handlers."""
+    first = setup_logger(unique_logger_name, "logs/test.log")
+    second = setup_logger(unique_logger_name, "logs/test.log")
+
+    assert second is first
+    assert len(second.handlers) == 2
+
+
 def test_get_vault_client_with_valid_token(mock_vault_client):
     """Test Vault client initialization with valid credentials."""
     with patch("dags.src.utils.helpers.hvac.Client", return_value=mock_vault_client):
@@ -42,3 +65,39 @@ def test_get_vault_client_authentication_failure(mock_vault_client):
         with patch.dict(os.environ, {"VAULT_DEV_ROOT_TOKEN_ID": "invalid"}):
             with pytest.raises(hvac.exceptions.VaultError, match="Failed to authenticate"):
                 get_vault_client()
+
+
+def test_ttl_cache_reuses_result_until_expiry(monkeypatch):
+    """Test cached results are returned until the TTL elapses."""
+    now = [1000.0]
+    monkeypatch.setattr(helpers.time, "monotonic", lambda: now[0])
+    calls = []
+
+    @ttl_cache(ttl=300)
+    def fetch(client):
+        calls.append(client)
+        return len(calls)
+
+    client = object()
+    assert fetch(client) == 1
+    assert fetch(client) == 1
+    assert fetch(object()) == 2
+
+    now[0] += 301
+    assert fetch(client) == 3
+
+
+def test_ttl_cache_does_not_cache_errors():
+    """Test a failing call is retried on the next invocation."""
+    outcomes = iter([ValueError("boom"), "ok"])
+
+    @ttl_cache(ttl=300)
+    def fetch():
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with pytest.raises(ValueError, match="boom"):
+        fetch()
+    assert fetch() == "ok"
@@ -1,5 +1,6 @@
 """Unit tests for MinIO ingestion module."""
 
+import io
 import os
 from unittest.mock import MagicMock, patch
 
@@ -8,13 +9,17 @@ import pytest
 from minio.error import S3Error
 from unittest.mock import Mock
 
+from dags.src.ingestion import minio_client
 from dags.src.ingestion.minio_client import (
+    _parallel_get,
+    _write_parquet,
     get_minio_client,
     get_minio_credentials,
     get_object_size,
     get_raw_data,
     list_raw_keys,
     move_processed_file,
+    move_processed_files,
 )
 
 
@@ -28,6 +33,15 @@ def test_get_minio_credentials_success(mock_vault_client):
     assert isinstance(credentials[3], bool)  # secure flag
 
 
+def test_get_minio_credentials_cached_per_client(mock_vault_client):
+    """Test repeated credential lookups reuse the first Vault response."""
+    first = get_minio_credentials(mock_vault_client)
+    second = get_minio_credentials(mock_vault_client)
+
+    assert second == first
+    mock_vault_client.secrets.kv.v2.read_secret_version.assert_called_once()
+
+
 def test_get_minio_credentials_vault_error():
     """Test MinIO credentials retrieval with Vault error."""
     mock_vault = MagicMock()
@@ -38,7 +52,7 @@ def test_get_minio_credentials_vault_error():
 
 
 def test_get_minio_client_success(mock_vault_client):
-    """Test successful MinIO client initialization."""
+    """Test MinIO client is built once and reused for the same credentials."""
     with patch("dags.src.ingestion.minio_client.Minio") as mock_minio:
         mock_client = MagicMock()
         mock_client.bucket_exists.return_value = True
@@ -46,10 +60,17 @@ def test_get_minio_client_success(mock_vault_client):
 
         with patch.dict(os.environ, {"MINIO_SECURE": "False"}):
             client = get_minio_client(mock_vault_client)
+            again = get_minio_client(mock_vault_client)
 
             assert client is not None
+            assert again is client
+            mock_minio.assert_called_once()
             mock_client.bucket_exists.assert_called_once_with("data-platform")
 
+            http_client = mock_minio.call_args.kwargs["http_client"]
+            assert http_client.connection_pool_kw["maxsize"] == 32
+            assert http_client.connection_pool_kw["block"] is False
+
 
 def test_get_minio_client_bucket_not_found(mock_vault_client):
     """Test MinIO client initialization when bucket doesn't exist."""
@@ -94,31 +115,51 @@ def test_get_object_size_not_found(mock_minio_client):
 
 def test_get_raw_data_small_file(mock_minio_client):
     """Test reading small CSV file without chunking."""
-    csv_content = "order_id,customer_name,order_date,delivery_date,data_collected_at\n"
-    csv_content += "ABC123,John Doe,2025-01-01,2025-01-05,2025-01-01\n"
+    csv_content = "order_id,customer_name,product_category,quantity,"
+    csv_content += "order_date,delivery_date,data_collected_at\n"
+    csv_content += "0000123456,John Doe,Electronics,2,2025-01-01,2025-01-05,2025-01-01\n"
 
     mock_response = MagicMock()
-    mock_response.read.return_value = csv_content.encode()
+    mock_response.read.side_effect = io.BytesIO(csv_content.encode()).read
     mock_minio_client.get_object.return_value = mock_response
 
-    mock_stat = MagicMock()
-    mock_stat.size = 500  # Small file
-    mock_minio_client.stat_object.return_value = mock_stat
-
-    df = get_raw_data(mock_minio_client, "raw/small.csv")
+    df = get_raw_data(mock_minio_client, "raw/small.csv", size=500)  # Small file
 
     assert isinstance(df, pd.DataFrame)
     assert len(df) == 1
-    assert df["order_id"].iloc[0] == "ABC123"
+    assert df["order_id"].iloc[0] == "0000123456"
+    assert df["quantity"].dtype == "Int32"
+    assert isinstance(df["product_category"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df["order_date"])
+    mock_minio_client.stat_object.assert_not_called()
+    mock_response.release_conn.assert_called_once()
+
+
+def test_get_raw_data_empty_cells_are_missing(mock_minio_client):
+    """Test empty text, integer and date cells are read as missing values."""
+    csv_content = "order_id,customer_name,quantity,delivery_date\n"
+    csv_content += "0000123456,,,\n"
+
+    mock_response = MagicMock()
+    mock_response.read.side_effect = io.BytesIO(csv_content.encode()).read
+    mock_minio_client.get_object.return_value = mock_response
 
+    df = get_raw_data(mock_minio_client, "raw/small.csv", size=500)
 
-def test_get_raw_data_large_file_chunking(mock_minio_client):
+    assert df["customer_name"].dtype == "string[pyarrow]"
+    assert df[["customer_name", "quantity", "delivery_date"]].isna().all(axis=None)
+    assert pd.api.types.is_datetime64_any_dtype(df["delivery_date"])
+
+
+def test_get_raw_data_large_file_chunking(mock_minio_client, monkeypatch):
     """Test reading large CSV file with chunking."""
+    # Exercise single-stream chunking; ranged downloads are covered separately
+    monkeypatch.setattr(minio_client, "PARALLEL_DOWNLOAD_THRESHOLD", 4 * 1024 * 1024 * 1024)
     csv_content = "order_id,customer_name,order_date,delivery_date,data_collected_at\n"
     csv_content += "ABC123,John Doe,2025-01-01,2025-01-05,2025-01-01\n"
 
     mock_response = MagicMock()
-    mock_response.read.return_value = csv_content.encode()
+    mock_response.read.side_effect = io.BytesIO(csv_content.encode()).read
     mock_minio_client.get_object.return_value = mock_response
 
     mock_stat = MagicMock()
@@ -132,21 +173,70 @@ def test_get_raw_data_large_file_chunking(mock_minio_client):
 
     assert isinstance(result, Iterator)
 
+    # Connection stays open until the chunks have been consumed
+    mock_response.release_conn.assert_not_called()
+    chunks = list(result)
+    assert sum(len(chunk) for chunk in chunks) == 1
+    mock_response.release_conn.assert_called_once()
+
+
+def _ranged_get_object(data: bytes):
+    """Build a get_object side effect serving byte ranges of ``data``."""
+
+    def get_object(bucket_name, object_name, offset=0, length=0):
+        response = MagicMock()
+        response.read.return_value = data[offset : offset + length]
+        return response
+
+    return get_object
+
+
+def test_parallel_get_fetches_non_overlapping_ranges(mock_minio_client):
+    """Test parallel download issues disjoint ranged GETs and preserves order."""
+    data = b"0123456789abcdefghij"
+    mock_minio_client.get_object.side_effect = _ranged_get_object(data)
+
+    parts = list(
+        _parallel_get(mock_minio_client, "raw/large.csv", len(data), part_size=6, workers=2)
+    )
+
+    assert b"".join(parts) == data
+    ranges = sorted(
+        (c.kwargs["offset"], c.kwargs["length"])
+        for c in mock_minio_client.get_object.call_args_list
+    )
+    assert ranges == [(0, 6), (6, 6), (12, 6), (18, 2)]
+
+
+def test_get_raw_data_uses_parallel_ranges_for_large_objects(mock_minio_client, monkeypatch):
+    """Test objects over the parallel threshold are parsed from ranged downloads."""
+    csv_content = b"order_id,quantity\n" + b"".join(f"ORD{i:07d},{i}\n".encode() for i in range(50))
+    monkeypatch.setattr(minio_client, "PARALLEL_DOWNLOAD_THRESHOLD", 100)
+    monkeypatch.setattr(minio_client, "RANGE_PART_SIZE", 64)
+    mock_minio_client.stat_object.return_value = MagicMock(size=len(csv_content))
+    mock_minio_client.get_object.side_effect = _ranged_get_object(csv_content)
+
+    df = get_raw_data(mock_minio_client, "raw/large.csv")
+
+    assert len(df) == 50
+    assert df["quantity"].sum() == sum(range(50))
+    assert mock_minio_client.get_object.call_count == -(-len(csv_content) // 64)
+
 
 def test_list_raw_keys_success(mock_minio_client):
-    """Test listing raw object keys."""
+    """Test listing raw object keys with their sizes."""
     mock_obj1 = MagicMock()
     mock_obj1.object_name = "raw/file1.csv"
+    mock_obj1.size = 1024
     mock_obj2 = MagicMock()
     mock_obj2.object_name = "raw/file2.csv"
+    mock_obj2.size = 2048
 
     mock_minio_client.list_objects.return_value = [mock_obj1, mock_obj2]
 
-    keys = list_raw_keys(mock_minio_client)
+    keys = list(list_raw_keys(mock_minio_client))
 
-    assert len(keys) == 2
-    assert "raw/file1.csv" in keys
-    assert "raw/file2.csv" in keys
+    assert keys == [("raw/file1.csv", 1024), ("raw/file2.csv", 2048)]
     mock_minio_client.list_objects.assert_called_once_with(
         "data-platform", prefix="raw/", recursive=True
     )
@@ -156,38 +246,147 @@ def test_list_raw_keys_empty(mock_minio_client):
     """Test listing raw keys when no objects exist."""
     mock_minio_client.list_objects.return_value = []
 
-    keys = list_raw_keys(mock_minio_client)
+    keys = list(list_raw_keys(mock_minio_client))
 
     assert len(keys) == 0
 
 
-def test_move_processed_file_success(mock_minio_client):
-    """Test successful file move from raw to processed."""
+def test_move_processed_file_success(mock_minio_client, make_minio_object):
+    """Test successful file move from raw/ CSV to processed/ Parquet."""
+    response, stat = make_minio_object(b"order_id,quantity\nABC1234567,2\n")
+    mock_minio_client.get_object.return_value = response
+    mock_minio_client.stat_object.return_value = stat
+
     destination = move_processed_file(mock_minio_client, "raw/test.csv")
 
-    assert destination == "processed/test.csv"
-    mock_minio_client.copy_object.assert_called_once()
+    assert destination == "processed/test.parquet"
+    mock_minio_client.copy_object.assert_not_called()
+    mock_minio_client.put_object.assert_called_once()
+    assert mock_minio_client.put_object.call_args.args[:2] == (
+        "data-platform",
+        "processed/test.parquet",
+    )
     mock_minio_client.remove_object.assert_called_once_with("data-platform", "raw/test.csv")
 
 
+def test_move_processed_file_reuses_known_size(mock_minio_client, make_minio_object):
+    """Test a size resolved earlier in the run saves the stat_object round-trip."""
+    csv_data = b"order_id,quantity\nABC1234567,2\n"
+    response, _ = make_minio_object(csv_data)
+    mock_minio_client.get_object.return_value = response
+
+    move_processed_file(mock_minio_client, "raw/test.csv", size=len(csv_data))
+
+    mock_minio_client.stat_object.assert_not_called()
+    mock_minio_client.put_object.assert_called_once()
+
+
+def test_write_parquet_chunks_with_growing_category_cardinality():
+    """Test a later chunk with 128+ categories fits the first chunk's schema."""
+    chunks = [
+        pd.DataFrame({"product_title": pd.Categorical([f"title {i}" for i in range(size)])})
+        for size in (2, 300)
+    ]
+    sink = io.BytesIO()
+
+    _write_parquet(iter(chunks), sink)
+
+    result = pd.read_parquet(io.BytesIO(sink.getvalue()))
+    assert len(result) == 302
+    assert result["product_title"].iloc[-1] == "title 299"
+    assert isinstance(result["product_title"].dtype, pd.CategoricalDtype)
+
+
+def test_move_processed_file_parquet_round_trip(
+    mock_minio_client, make_minio_object, sample_sales_data
+):
+    """Test the uploaded Parquet archive reads back as the original data."""
+    response, stat = make_minio_object(sample_sales_data.to_csv(index=False).encode())
+    mock_minio_client.get_object.return_value = response
+    mock_minio_client.stat_object.return_value = stat
+    uploaded = {}
+    mock_minio_client.put_object.side_effect = lambda bucket, key, data, length, **kwargs: (
+        uploaded.update(key=key, body=data.read(length))
+    )
+
+    move_processed_file(mock_minio_client, "raw/sales.csv")
+
+    result = pd.read_parquet(io.BytesIO(uploaded["body"]))
+    expected = sample_sales_data.astype(
+        {
+            "order_id": "string",
+            "customer_name": "string",
+            "customer_email": "string",
+            "customer_phone": "string",
+            "customer_address": "string",
+            "discount_percentage": "Int32",
+            "quantity": "Int32",
+            "delivery_date": "datetime64[ns]",
+            "data_collected_at": "datetime64[ns]",
+            "order_date": "datetime64[ns]",
+            "product_title": "category",
+            "product_category": "category",
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_move_processed_file_reuses_loaded_data(mock_minio_client, sample_sales_data):
+    """Test passing the already-read frame skips downloading the CSV again."""
+    destination = move_processed_file(mock_minio_client, "raw/test.csv", data=sample_sales_data)
+
+    assert destination == "processed/test.parquet"
+    mock_minio_client.get_object.assert_not_called()
+    mock_minio_client.stat_object.assert_not_called()
+    mock_minio_client.put_object.assert_called_once()
+
+
+def test_move_processed_files_batches_removal(mock_minio_client, make_minio_object):
+    """Test moving many files uploads each archive and deletes originals in one call."""
+    csv_data = b"order_id,quantity\nABC1234567,2\n"
+
+    def fresh_response(*args, **kwargs):
+        return make_minio_object(csv_data)[0]
+
+    mock_minio_client.get_object.side_effect = fresh_response
+    mock_minio_client.stat_object.return_value = make_minio_object(csv_data)[1]
+    mock_minio_client.remove_objects.return_value = iter([])
+    keys = [f"raw/batch_{i}.csv" for i in range(10)]
+
+    destinations = move_processed_files(mock_minio_client, keys)
+
+    assert destinations == [f"processed/batch_{i}.parquet" for i in range(10)]
+    assert mock_minio_client.put_object.call_count == 10
+    mock_minio_client.remove_object.assert_not_called()
+    mock_minio_client.remove_objects.assert_called_once()
+    bucket, delete_list = mock_minio_client.remove_objects.call_args.args
+    assert bucket == "data-platform"
+    assert [obj.name for obj in delete_list] == keys
+
+
 def test_move_processed_file_invalid_source(mock_minio_client):
     """Test move with invalid source prefix."""
     with pytest.raises(ValueError, match="Source key must start with 'raw/'"):
         move_processed_file(mock_minio_client, "invalid/test.csv")
 
 
-def test_move_processed_file_copy_error(mock_minio_client):
-    """Test file move with copy error."""
+def test_move_processed_file_upload_error(mock_minio_client, make_minio_object):
+    """Test file move with upload error leaves the raw object in place."""
+    response, stat = make_minio_object(b"order_id,quantity\nABC1234567,2\n")
+    mock_minio_client.get_object.return_value = response
+    mock_minio_client.stat_object.return_value = stat
     mock_response = Mock()
     mock_response.status = 500
-    mock_minio_client.copy_object.side_effect = S3Error(
+    mock_minio_client.put_object.side_effect = S3Error(
         response=mock_response,
-        code="CopyError",
-        message="Copy failed",
-        resource="raw/test.csv",
+        code="PutError",
+        message="Upload failed",
+        resource="processed/test.parquet",
         request_id="req123",
         host_id="host456",
     )
 
     with pytest.raises(S3Error):
         move_processed_file(mock_minio_client, "raw/test.csv")
+
+    mock_minio_client.remove_object.assert_not_called()
@@ -1,14 +1,19 @@
 """Unit tests for PostgreSQL loading module."""
 
 import os
+import struct
 from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import psycopg2
+import pyarrow as pa
 import pytest
 
+from dags.src.loading import postgres_loader
 from dags.src.loading.postgres_loader import (
+    COPY_BUFFER_SIZE,
+    _encode_pgcopy_binary,
     get_postgres_connection,
     get_postgres_credentials,
     upsert_data,
@@ -17,6 +22,25 @@ from dags.src.loading.postgres_loader import (
     upsert_dimension_product,
     upsert_fact_sales,
 )
+from tests._fixtures import decode_pgcopy_rows
+
+
+@pytest.fixture(autouse=True)
+def mock_execute_values():
+    """Route execute_values through the mock cursor's execute/fetchall.
+
+    The real helper needs a live connection to mogrify rows; delegating keeps
+    cursor-level side effects (e.g. raised errors) observable in these tests.
+    """
+
+    def _execute_values(cursor, sql, argslist, page_size=100, fetch=False):
+        cursor.execute(sql, argslist)
+        return cursor.fetchall() if fetch else None
+
+    with patch(
+        "dags.src.loading.postgres_loader.execute_values", side_effect=_execute_values
+    ) as mock:
+        yield mock
 
 
 def test_get_postgres_credentials_success(mock_vault_client):
@@ -77,74 +101,143 @@ def test_get_postgres_connection_error(mock_vault_client):
             get_postgres_connection(mock_vault_client)
 
 
-def test_upsert_dimension_customer_success(mock_postgres_connection, sample_sales_data):
+def test_upsert_dimension_customer_success(mock_postgres_connection, mutable_sales_data):
     """Test successful customer dimension upsert."""
     # Add required columns for transformation
-    sample_sales_data["customer_email_hash"] = "hash123"
-    sample_sales_data["customer_phone_redacted"] = "***-****"
-    sample_sales_data["customer_address_redacted"] = "*** **** **"
-
-    result_df = upsert_dimension_customer(mock_postgres_connection, sample_sales_data)
-
-    assert "customer_id" in result_df.columns
+    mutable_sales_data["customer_email_hash"] = "hash123"
+    mutable_sales_data["customer_phone_redacted"] = "***-****"
+    mutable_sales_data["customer_address_redacted"] = "*** **** **"
+    mock_cursor = mock_postgres_connection.cursor.return_value
+    mock_cursor.fetchall.return_value = [(7, "hash123")]
+
+    result_df = upsert_dimension_customer(mock_postgres_connection, mutable_sales_data)
+
+    # One unique customer is staged with COPY, then merged
+    sql, buffer = mock_cursor.copy_expert.call_args.args
+    assert sql.startswith("COPY stg_dim_customer")
+    assert decode_pgcopy_rows(buffer.getvalue()) == [
+        [b"John Doe", b"hash123", b"***-****", b"*** **** **"]
+    ]
+    assert "RETURNING customer_id, email_hash" in mock_cursor.execute.call_args.args[0]
+    assert result_df["customer_id"].tolist() == [7, 7]
     assert mock_postgres_connection.commit.called
     assert mock_postgres_connection.cursor.called
 
 
-def test_upsert_dimension_customer_database_error(mock_postgres_connection, sample_sales_data):
+def test_encode_pgcopy_binary_in_row_batches(monkeypatch):
+    """Test batched encoding matches one pass, with long text only padding its batch."""
+    names = ["a", "b" * 255, None, "é", "c", "d" * 40, "e"]
+    df = pd.DataFrame(
+        {
+            "name": names,
+            # Same values backed by a multi-chunk Arrow array, split mid-batch
+            "chunked_name": pd.arrays.ArrowStringArray(
+                pa.chunked_array([names[:4], names[4:]], type=pa.string())
+            ),
+            "quantity": [1, 2, 3, None, 5, 6, 7],
+        }
+    ).astype({"quantity": "Int32"})
+    layout = (("name", "text"), ("quantity", "int4"))
+    single_pass = _encode_pgcopy_binary(df, layout)
+
+    monkeypatch.setattr(postgres_loader, "COPY_ENCODE_BATCH_ROWS", 3)
+    batched = _encode_pgcopy_binary(df, layout)
+    chunked = _encode_pgcopy_binary(df, (("chunked_name", "text"), ("quantity", "int4")))
+
+    assert batched == single_pass
+    assert chunked == single_pass
+    assert decode_pgcopy_rows(batched)[1] == [b"b" * 255, struct.pack(">i", 2)]
+    assert decode_pgcopy_rows(batched)[3] == ["é".encode(), None]
+
+
+def test_upsert_dimension_customer_database_error(mock_postgres_connection, mutable_sales_data):
     """Test customer upsert with database error."""
-    sample_sales_data["customer_email_hash"] = "hash123"
-    sample_sales_data["customer_phone_redacted"] = "***-****"
-    sample_sales_data["customer_address_redacted"] = "*** **** **"
+    mutable_sales_data["customer_email_hash"] = "hash123"
+    mutable_sales_data["customer_phone_redacted"] = "***-****"
+    mutable_sales_data["customer_address_redacted"] = "*** **** **"
 
     mock_cursor = mock_postgres_connection.cursor.return_value
     mock_cursor.execute.side_effect = psycopg2.Error("DB error")
 
     with pytest.raises(psycopg2.Error):
-        upsert_dimension_customer(mock_postgres_connection, sample_sales_data)
+        upsert_dimension_customer(mock_postgres_connection, mutable_sales_data)
 
     assert mock_postgres_connection.rollback.called
 
 
-def test_upsert_dimension_product_success(mock_postgres_connection, sample_sales_data):
+def test_upsert_dimension_product_success(
+    mock_postgres_connection, mutable_sales_data, mock_execute_values
+):
     """Test successful product dimension upsert."""
-    result_df = upsert_dimension_product(mock_postgres_connection, sample_sales_data)
+    mock_cursor = mock_postgres_connection.cursor.return_value
+    mock_cursor.fetchall.return_value = [
+        (3, "Premium Laptop - Electronics Edition", "Electronics"),
+        (4, "Running Shoes - Sports Edition", "Sports"),
+    ]
+
+    result_df = upsert_dimension_product(mock_postgres_connection, mutable_sales_data)
 
-    assert "product_id" in result_df.columns
+    mock_execute_values.assert_called_once()
+    assert result_df["product_id"].tolist() == [3, 4]
     assert mock_postgres_connection.commit.called
 
 
-def test_upsert_dimension_product_database_error(mock_postgres_connection, sample_sales_data):
+def test_upsert_dimension_product_database_error(mock_postgres_connection, mutable_sales_data):
     """Test product upsert with database error."""
     mock_cursor = mock_postgres_connection.cursor.return_value
     mock_cursor.execute.side_effect = psycopg2.Error("DB error")
 
     with pytest.raises(psycopg2.Error):
-        upsert_dimension_product(mock_postgres_connection, sample_sales_data)
+        upsert_dimension_product(mock_postgres_connection, mutable_sales_data)
 
     assert mock_postgres_connection.rollback.called
 
 
-def test_upsert_dimension_date_success(mock_postgres_connection, sample_sales_data):
+def test_upsert_dimension_date_success(
+    mock_postgres_connection, mutable_sales_data, mock_execute_values
+):
     """Test successful date dimension upsert."""
-    result_df = upsert_dimension_date(mock_postgres_connection, sample_sales_data)
+    result_df = upsert_dimension_date(mock_postgres_connection, mutable_sales_data)
 
-    assert "order_date_id" in result_df.columns
+    mock_execute_values.assert_called_once()
+    # Three distinct dates across order_date and delivery_date
+    assert len(mock_execute_values.call_args.args[2]) == 3
+    assert result_df["order_date_id"].tolist() == [1, 1]
     assert "delivery_date_id" in result_df.columns
     assert mock_postgres_connection.commit.called
 
 
-def test_upsert_dimension_date_database_error(mock_postgres_connection, sample_sales_data):
+def test_upsert_dimension_date_database_error(mock_postgres_connection, mutable_sales_data):
     """Test date upsert with database error."""
     mock_cursor = mock_postgres_connection.cursor.return_value
     mock_cursor.execute.side_effect = psycopg2.Error("DB error")
 
     with pytest.raises(psycopg2.Error):
-        upsert_dimension_date(mock_postgres_connection, sample_sales_data)
+        upsert_dimension_date(mock_postgres_connection, mutable_sales_data)
 
     assert mock_postgres_connection.rollback.called
 
 
+def test_upsert_dimensions_add_ids_to_input_frame(mock_postgres_connection, mutable_sales_data):
+    """Test dimension upserts write their ID columns into the caller's frame."""
+    mutable_sales_data["customer_email_hash"] = "hash123"
+    mutable_sales_data["customer_phone_redacted"] = "***-****"
+    mutable_sales_data["customer_address_redacted"] = "*** **** **"
+    mock_cursor = mock_postgres_connection.cursor.return_value
+    mock_cursor.fetchall.side_effect = [
+        [(7, "hash123")],
+        [(3, "Premium Laptop - Electronics Edition", "Electronics")],
+        [],
+    ]
+
+    for upsert in (upsert_dimension_customer, upsert_dimension_product, upsert_dimension_date):
+        assert upsert(mock_postgres_connection, mutable_sales_data) is mutable_sales_data
+
+    assert {"customer_id", "product_id", "order_date_id", "delivery_date_id"} <= set(
+        mutable_sales_data.columns
+    )
+
+
 def test_upsert_fact_sales_success(mock_postgres_connection):
     """Test successful fact sales upsert."""
     sales_df = pd.DataFrame(
@@ -169,7 +262,69 @@ def test_upsert_fact_sales_success(mock_postgres_connection):
 
     assert mock_postgres_connection.commit.called
     mock_cursor = mock_postgres_connection.cursor.return_value
-    assert mock_cursor.execute.called
+    mock_cursor.copy_expert.assert_called_once()
+    copy_sql, copy_buffer = mock_cursor.copy_expert.call_args.args
+    assert copy_sql.startswith("COPY stg_fact_sales")
+    assert "FORMAT BINARY" in copy_sql
+    assert mock_cursor.copy_expert.call_args.kwargs["size"] == COPY_BUFFER_SIZE
+
+    [row] = decode_pgcopy_rows(copy_buffer.getvalue())
+    assert row[0] == b"ABC123"
+    assert [struct.unpack(">i", field)[0] for field in row[1:6]] == [1, 1, 1, 1, 2]
+    assert struct.unpack(">d", row[6])[0] == 99.99
+    assert struct.unpack(">i", row[8])[0] == 33
+    assert struct.unpack(">i", row[10])[0] == (date(2025, 10, 1) - date(2000, 1, 1)).days
+
+
+def test_upsert_fact_sales_dedupes_orders_and_nulls_missing_delivery(mock_postgres_connection):
+    """Test staged rows keep the last duplicate order and emit NULL delivery IDs."""
+    row = {
+        "order_id": "ABC123",
+        "customer_id": 1,
+        "product_id": 1,
+        "order_date_id": 1,
+        "delivery_date_id": None,
+        "quantity": 2,
+        "discounted_price": 99.99,
+        "original_price": 149.99,
+        "discount_percentage": 33,
+        "profit": 15.00,
+        "data_collected_at": date(2025, 10, 1),
+    }
+    sales_df = pd.DataFrame([row, {**row, "quantity": 5}])
+
+    upsert_fact_sales(mock_postgres_connection, sales_df)
+
+    mock_cursor = mock_postgres_connection.cursor.return_value
+    _, copy_buffer = mock_cursor.copy_expert.call_args.args
+    [row] = decode_pgcopy_rows(copy_buffer.getvalue())
+    assert row[4] is None
+    assert struct.unpack(">i", row[5])[0] == 5
+
+
+def test_upsert_fact_sales_encodes_utf8_and_null_text(mock_postgres_connection):
+    """Test text fields carry their UTF-8 byte length and missing text is NULL."""
+    row = {
+        "order_id": "ÄBC1234567",
+        "customer_id": 1,
+        "product_id": 1,
+        "order_date_id": 1,
+        "delivery_date_id": 1,
+        "quantity": 2,
+        "discounted_price": 99.99,
+        "original_price": 149.99,
+        "discount_percentage": 33,
+        "profit": 15.00,
+        "data_collected_at": date(2025, 10, 1),
+    }
+    sales_df = pd.DataFrame([row, {**row, "order_id": None}, {**row, "order_id": "X"}])
+
+    upsert_fact_sales(mock_postgres_connection, sales_df)
+
+    mock_cursor = mock_postgres_connection.cursor.return_value
+    _, copy_buffer = mock_cursor.copy_expert.call_args.args
+    rows = decode_pgcopy_rows(copy_buffer.getvalue())
+    assert [r[0] for r in rows] == ["ÄBC1234567".encode(), None, b"X"]
 
 
 def test_upsert_fact_sales_database_error(mock_postgres_connection):
@@ -201,24 +356,43 @@ def test_upsert_fact_sales_database_error(mock_postgres_connection):
     assert mock_postgres_connection.rollback.called
 
 
-def test_upsert_data_single_dataframe(mock_vault_client, sample_sales_data):
-    """Test upserting a single DataFrame."""
-    sample_sales_data["customer_email_hash"] = "hash123"
-    sample_sales_data["customer_phone_redacted"] = "***-****"
-    sample_sales_data["customer_address_redacted"] = "*** **** **"
-    sample_sales_data["profit"] = 50.0
+def _mock_connection(fetchall_rows):
+    """Build a mock connection whose cursor returns ``fetchall_rows``."""
+    conn = MagicMock()
+    conn.cursor.return_value.fetchall.return_value = fetchall_rows
+    return conn
 
-    with patch("dags.src.loading.postgres_loader.get_postgres_connection") as mock_get_conn:
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = (1,)
-        mock_cursor.fetchall.return_value = [(1, date(2025, 10, 15))]
-        mock_get_conn.return_value = mock_conn
 
-        upsert_data(mock_vault_client, sample_sales_data)
+def test_upsert_data_single_dataframe(mock_vault_client, mutable_sales_data):
+    """Test dimensions load on their own connections and IDs reach the fact load."""
+    mutable_sales_data["customer_email_hash"] = "hash123"
+    mutable_sales_data["customer_phone_redacted"] = "***-****"
+    mutable_sales_data["customer_address_redacted"] = "*** **** **"
+    mutable_sales_data["profit"] = 50.0
 
-        assert mock_conn.close.called
+    customer_conn = _mock_connection([(1, "hash123")])
+    product_conn = _mock_connection(
+        [
+            (1, "Premium Laptop - Electronics Edition", "Electronics"),
+            (2, "Running Shoes - Sports Edition", "Sports"),
+        ]
+    )
+    date_conn = _mock_connection(
+        [(1, date(2025, 10, 15)), (2, date(2025, 11, 1)), (3, date(2025, 10, 25))]
+    )
+    connections = [customer_conn, product_conn, date_conn]
+
+    with patch("dags.src.loading.postgres_loader.get_postgres_connection", side_effect=connections):
+        upsert_data(mock_vault_client, mutable_sales_data)
+
+    for conn in connections:
+        assert conn.commit.called
+        assert conn.close.called
+    assert mutable_sales_data["customer_id"].tolist() == [1, 1]
+    assert mutable_sales_data["product_id"].tolist() == [1, 2]
+    # Facts are loaded on the first connection once its customers are staged
+    copies = customer_conn.cursor.return_value.copy_expert.call_args_list
+    assert [c.args[0].split()[1] for c in copies] == ["stg_dim_customer", "stg_fact_sales"]
 
 
 def test_upsert_data_invalid_type(mock_vault_client):
@@ -231,11 +405,11 @@ def test_upsert_data_invalid_type(mock_vault_client):
             upsert_data(mock_vault_client, "invalid_data")
 
 
-def test_upsert_data_connection_cleanup(mock_vault_client, sample_sales_data):
+def test_upsert_data_connection_cleanup(mock_vault_client, mutable_sales_data):
     """Test that connection is closed even on error."""
-    sample_sales_data["customer_email_hash"] = "hash123"
-    sample_sales_data["customer_phone_redacted"] = "***-****"
-    sample_sales_data["customer_address_redacted"] = "*** **** **"
+    mutable_sales_data["customer_email_hash"] = "hash123"
+    mutable_sales_data["customer_phone_redacted"] = "***-****"
+    mutable_sales_data["customer_address_redacted"] = "*** **** **"
 
     with patch("dags.src.loading.postgres_loader.get_postgres_connection") as mock_get_conn:
         mock_conn = MagicMock()
@@ -245,7 +419,7 @@ def test_upsert_data_connection_cleanup(mock_vault_client, sample_sales_data):
         mock_get_conn.return_value = mock_conn
 
         with pytest.raises(psycopg2.Error):
-            upsert_data(mock_vault_client, sample_sales_data)
+            upsert_data(mock_vault_client, mutable_sales_data)
 
         # Connection should still be closed
         assert mock_conn.close.called
@@ -1,24 +1,46 @@
 """Unit tests for ETL pipeline orchestrator."""
 
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pandas as pd
 import pytest
 from minio.error import S3Error
 
+from dags.src.ingestion import minio_client
 from dags.src.pipeline import run_pipeline, save_invalid_data_to_quarantine
+from tests._fixtures import load_csv_asset
 
 
-def test_save_invalid_data_to_quarantine_success(mock_minio_client, sample_invalid_data):
+def test_save_invalid_data_to_quarantine_success(mock_minio_client, mutable_invalid_data):
     """Test successful quarantine of invalid records."""
-    sample_invalid_data["validation_error"] = "Invalid data"
+    mutable_invalid_data["validation_error"] = "Invalid data"
 
-    save_invalid_data_to_quarantine(mock_minio_client, sample_invalid_data, "raw/test.csv")
+    save_invalid_data_to_quarantine(mock_minio_client, mutable_invalid_data, "raw/test.csv")
 
     mock_minio_client.put_object.assert_called_once()
     args = mock_minio_client.put_object.call_args
     assert args[0][0] == "data-platform"
-    assert args[0][1] == "quarantine/test.csv"
+    assert args[0][1] == "quarantine/test.parquet"
+
+    # Uploaded bytes read back as the quarantined records
+    quarantined = pd.read_parquet(args[0][2])
+    assert quarantined["order_id"].tolist() == mutable_invalid_data["order_id"].tolist()
+    assert (quarantined["validation_error"] == "Invalid data").all()
+
+
+def test_save_invalid_data_to_quarantine_mixed_chunk_types(mock_minio_client):
+    """Test invalid chunks whose columns were inferred differently still encode."""
+    first = pd.DataFrame({"order_id": ["INV1"], "is_best_seller": [True], "quantity": [0]})
+    second = pd.DataFrame({"order_id": ["INV2"], "is_best_seller": ["maybe"], "quantity": ["x"]})
+    invalid_df = pd.concat([first, second], ignore_index=True)
+    invalid_df["validation_error"] = "Invalid data"
+
+    save_invalid_data_to_quarantine(mock_minio_client, invalid_df, "raw/test.csv")
+
+    quarantined = pd.read_parquet(mock_minio_client.put_object.call_args.args[2])
+    assert quarantined["is_best_seller"].tolist() == ["True", "maybe"]
+    assert quarantined["quantity"].tolist() == ["0", "x"]
 
 
 def test_save_invalid_data_to_quarantine_empty_dataframe(mock_minio_client):
@@ -31,9 +53,9 @@ def test_save_invalid_data_to_quarantine_empty_dataframe(mock_minio_client):
     mock_minio_client.put_object.assert_not_called()
 
 
-def test_save_invalid_data_to_quarantine_s3_error(mock_minio_client, sample_invalid_data):
+def test_save_invalid_data_to_quarantine_s3_error(mock_minio_client, mutable_invalid_data):
     """Test quarantine with S3 upload error."""
-    sample_invalid_data["validation_error"] = "Invalid data"
+    mutable_invalid_data["validation_error"] = "Invalid data"
     mock_response = Mock()
     mock_response.status = 500
     mock_minio_client.put_object.side_effect = S3Error(
@@ -46,189 +68,221 @@ def test_save_invalid_data_to_quarantine_s3_error(mock_minio_client, sample_inva
     )
 
     with pytest.raises(S3Error):
-        save_invalid_data_to_quarantine(mock_minio_client, sample_invalid_data, "raw/test.csv")
+        save_invalid_data_to_quarantine(mock_minio_client, mutable_invalid_data, "raw/test.csv")
+
+
+@pytest.fixture
+def pipeline_mocks(mock_minio_client):
+    """Patch every collaborator of run_pipeline with one patch.multiple.
+
+    Vault returns an empty stub and MinIO the shared client stub, since both
+    are only handed on to the patched stages. The object size is small, so
+    tests only set up the stages they exercise.
+
+    Yields:
+        SimpleNamespace of the mocks, named after the patched functions.
+    """
+    with patch.multiple(
+        "dags.src.pipeline",
+        get_vault_client=DEFAULT,
+        get_minio_client=DEFAULT,
+        get_object_size=DEFAULT,
+        get_raw_data=DEFAULT,
+        validate_data=DEFAULT,
+        transform_sales_data=DEFAULT,
+        upsert_data=DEFAULT,
+        move_processed_file=DEFAULT,
+        save_invalid_data_to_quarantine=DEFAULT,
+    ) as mocks:
+        mocks["get_vault_client"].return_value = SimpleNamespace()
+        mocks["get_minio_client"].return_value = mock_minio_client
+        mocks["get_object_size"].return_value = 1024  # Small file
+        mocks["move_processed_file"].return_value = "processed/test.parquet"
+        yield SimpleNamespace(**mocks)
+
+
+def test_run_pipeline_success_single_dataframe(pipeline_mocks, sample_sales_data):
+    """Test successful pipeline execution with single DataFrame."""
+    mocks = pipeline_mocks
+    mocks.get_raw_data.return_value = sample_sales_data
+
+    # Valid data, no invalid data
+    mocks.validate_data.return_value = (sample_sales_data, pd.DataFrame())
+    mocks.transform_sales_data.return_value = sample_sales_data
+
+    run_pipeline("raw/test.csv")
+
+    # Verify all steps called
+    minio = mocks.get_minio_client.return_value
+    mocks.get_vault_client.assert_called_once()
+    mocks.get_minio_client.assert_called_once()
+    mocks.get_object_size.assert_called_once_with(minio, "raw/test.csv")
+    mocks.get_raw_data.assert_called_once()
+    mocks.validate_data.assert_called_once()
+    mocks.transform_sales_data.assert_called_once()
+    mocks.upsert_data.assert_called_once()
+    mocks.move_processed_file.assert_called_once_with(
+        minio, "raw/test.csv", data=sample_sales_data, size=1024
+    )
 
 
-def test_run_pipeline_success_single_dataframe(sample_sales_data):
-    """Test successful pipeline execution with single DataFrame."""
-    # Mock all dependencies
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        with patch("dags.src.pipeline.get_minio_client") as mock_minio:
-            with patch("dags.src.pipeline.get_object_size") as mock_size:
-                with patch("dags.src.pipeline.get_raw_data") as mock_get_data:
-                    with patch("dags.src.pipeline.validate_data") as mock_validate:
-                        with patch("dags.src.pipeline.transform_sales_data") as mock_transform:
-                            with patch("dags.src.pipeline.upsert_data") as mock_upsert:
-                                with patch("dags.src.pipeline.move_processed_file") as mock_move:
-                                    # Setup mocks
-                                    mock_vault.return_value = MagicMock()
-                                    mock_minio_instance = MagicMock()
-                                    mock_minio.return_value = mock_minio_instance
-                                    mock_size.return_value = 1024  # Small file
-                                    mock_get_data.return_value = sample_sales_data
-
-                                    # Valid data, no invalid data
-                                    mock_validate.return_value = (
-                                        sample_sales_data,
-                                        pd.DataFrame(),
-                                    )
-                                    mock_transform.return_value = sample_sales_data
-                                    mock_move.return_value = "processed/test.csv"
-
-                                    # Run pipeline
-                                    run_pipeline("raw/test.csv")
-
-                                    # Verify all steps called
-                                    mock_vault.assert_called_once()
-                                    mock_minio.assert_called_once()
-                                    mock_size.assert_called_once_with(
-                                        mock_minio_instance, "raw/test.csv"
-                                    )
-                                    mock_get_data.assert_called_once()
-                                    mock_validate.assert_called_once()
-                                    mock_transform.assert_called_once()
-                                    mock_upsert.assert_called_once()
-                                    mock_move.assert_called_once()
-
-
-def test_run_pipeline_with_invalid_records(sample_sales_data, sample_invalid_data):
+def test_run_pipeline_success_chunked(pipeline_mocks, sample_sales_data, sample_invalid_data):
+    """Test chunked ingestion loads every chunk and archives by re-reading the file."""
+    mocks = pipeline_mocks
+    mocks.get_object_size.return_value = 200 * 1024 * 1024
+    mocks.get_raw_data.return_value = (chunk for chunk in [sample_sales_data])
+    mocks.validate_data.return_value = iter([(sample_sales_data, sample_invalid_data)])
+    mocks.transform_sales_data.return_value = sample_sales_data
+
+    run_pipeline("raw/test.csv")
+
+    mocks.save_invalid_data_to_quarantine.assert_called_once()
+    loaded = mocks.upsert_data.call_args.args[1]
+    assert [len(chunk) for chunk in loaded] == [len(sample_sales_data)]
+    mocks.move_processed_file.assert_called_once_with(
+        mocks.get_minio_client.return_value, "raw/test.csv", data=None, size=200 * 1024 * 1024
+    )
+
+
+def test_run_pipeline_with_invalid_records(
+    pipeline_mocks, sample_sales_data, sample_invalid_data, sample_mixed_data
+):
     """Test pipeline with both valid and invalid records."""
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        with patch("dags.src.pipeline.get_minio_client") as mock_minio:
-            with patch("dags.src.pipeline.get_object_size") as mock_size:
-                with patch("dags.src.pipeline.get_raw_data") as mock_get_data:
-                    with patch("dags.src.pipeline.validate_data") as mock_validate:
-                        with patch("dags.src.pipeline.transform_sales_data") as mock_transform:
-                            with patch("dags.src.pipeline.upsert_data"):
-                                with patch("dags.src.pipeline.move_processed_file") as mock_move:
-                                    with patch(
-                                        "dags.src.pipeline.save_invalid_data_to_quarantine"
-                                    ) as mock_quarantine:
-                                        # Setup mocks
-                                        mock_vault.return_value = MagicMock()
-                                        mock_minio.return_value = MagicMock()
-                                        mock_size.return_value = 1024
-                                        mock_get_data.return_value = pd.concat(
-                                            [sample_sales_data, sample_invalid_data]
-                                        )
-
-                                        # Return valid and invalid data
-                                        mock_validate.return_value = (
-                                            sample_sales_data,
-                                            sample_invalid_data,
-                                        )
-                                        mock_transform.return_value = sample_sales_data
-                                        mock_move.return_value = "processed/test.csv"
-
-                                        # Run pipeline
-                                        run_pipeline("raw/test.csv")
-
-                                        # Verify quarantine was called
-                                        mock_quarantine.assert_called_once()
-
-
-def test_run_pipeline_all_invalid_records(sample_invalid_data):
+    mocks = pipeline_mocks
+    mocks.get_raw_data.return_value = sample_mixed_data
+
+    # Return valid and invalid data
+    mocks.validate_data.return_value = (sample_sales_data, sample_invalid_data)
+    mocks.transform_sales_data.return_value = sample_sales_data
+
+    run_pipeline("raw/test.csv")
+
+    # Verify quarantine was called
+    mocks.save_invalid_data_to_quarantine.assert_called_once()
+
+
+def test_run_pipeline_quarantine_error_after_load(
+    pipeline_mocks, sample_sales_data, sample_invalid_data
+):
+    """Test a failed quarantine upload still fails the run once loading is done."""
+    mocks = pipeline_mocks
+    mocks.get_raw_data.return_value = sample_sales_data
+    mocks.validate_data.return_value = (sample_sales_data, sample_invalid_data)
+    mocks.save_invalid_data_to_quarantine.side_effect = RuntimeError("quarantine failed")
+
+    with pytest.raises(RuntimeError, match="quarantine"):
+        run_pipeline("raw/test.csv")
+
+    # Loading is not blocked by the upload
+    mocks.upsert_data.assert_called_once()
+    mocks.move_processed_file.assert_not_called()
+
+
+def test_run_pipeline_all_invalid_records(pipeline_mocks, sample_invalid_data):
     """Test pipeline when all records are invalid."""
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        with patch("dags.src.pipeline.get_minio_client") as mock_minio:
-            with patch("dags.src.pipeline.get_object_size") as mock_size:
-                with patch("dags.src.pipeline.get_raw_data") as mock_get_data:
-                    with patch("dags.src.pipeline.validate_data") as mock_validate:
-                        with patch(
-                            "dags.src.pipeline.save_invalid_data_to_quarantine"
-                        ) as mock_quarantine:
-                            # Setup mocks
-                            mock_vault.return_value = MagicMock()
-                            mock_minio.return_value = MagicMock()
-                            mock_size.return_value = 1024
-                            mock_get_data.return_value = sample_invalid_data
-
-                            # All invalid, no valid data
-                            mock_validate.return_value = (
-                                pd.DataFrame(),
-                                sample_invalid_data,
-                            )
-
-                            # Run pipeline - should raise error
-                            with pytest.raises(ValueError, match="All records.*failed validation"):
-                                run_pipeline("raw/test.csv")
-
-                            # Quarantine should still be called
-                            mock_quarantine.assert_called_once()
-
-
-def test_run_pipeline_vault_error():
+    mocks = pipeline_mocks
+    mocks.get_raw_data.return_value = sample_invalid_data
+
+    # All invalid, no valid data
+    mocks.validate_data.return_value = (pd.DataFrame(), sample_invalid_data)
+
+    # Run pipeline - should raise error
+    with pytest.raises(ValueError, match="All records.*failed validation"):
+        run_pipeline("raw/test.csv")
+
+    # Quarantine should still be called
+    mocks.save_invalid_data_to_quarantine.assert_called_once()
+
+
+def test_run_pipeline_empty_file_skips_validation(pipeline_mocks):
+    """Test an empty file is archived without being validated or loaded."""
+    mocks = pipeline_mocks
+    mocks.get_object_size.return_value = 64
+    mocks.get_raw_data.return_value = pd.DataFrame(columns=["order_id"])
+
+    run_pipeline("raw/test.csv")
+
+    mocks.validate_data.assert_not_called()
+    mocks.upsert_data.assert_not_called()
+    mocks.move_processed_file.assert_called_once()
+
+
+@pytest.mark.parametrize("chunked", [False, True], ids=["single", "chunked"])
+def test_run_pipeline_quarantines_non_numeric_quantity(
+    chunked, mock_minio_client, make_minio_object, monkeypatch
+):
+    """Test a malformed numeric cell quarantines its row instead of failing the read."""
+    header, valid_row = load_csv_asset("mixed.csv").decode().splitlines()[:2]
+    bad_row = valid_row.replace("E2EVALID01", "E2EBADQTY1").replace(
+        ",1,2025-10-20", ",abc,2025-10-20"
+    )
+    csv_data = "\n".join([header, valid_row, bad_row]).encode()
+    response, stat = make_minio_object(csv_data)
+    mock_minio_client.get_object.return_value = response
+    mock_minio_client.stat_object.return_value = stat
+    if chunked:
+        monkeypatch.setattr(minio_client, "CHUNK_SIZE_THRESHOLD", 0)
+
+    with patch.multiple(
+        "dags.src.pipeline",
+        get_vault_client=DEFAULT,
+        get_minio_client=Mock(return_value=mock_minio_client),
+        upsert_data=DEFAULT,
+        move_processed_file=DEFAULT,
+    ) as mocks:
+        run_pipeline("raw/test.csv")
+
+    quarantine = mock_minio_client.put_object.call_args
+    assert quarantine.args[1] == "quarantine/test.parquet"
+    quarantined = pd.read_parquet(quarantine.args[2])
+    assert quarantined["order_id"].tolist() == ["E2EBADQTY1"]
+    assert "quantity" in quarantined["validation_error"].iloc[0]
+    mocks["upsert_data"].assert_called_once()
+
+
+def test_run_pipeline_vault_error(pipeline_mocks):
     """Test pipeline with Vault connection error."""
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        mock_vault.side_effect = Exception("Vault connection failed")
+    pipeline_mocks.get_vault_client.side_effect = Exception("Vault connection failed")
 
-        with pytest.raises(Exception, match="Vault connection failed"):
-            run_pipeline("raw/test.csv")
+    with pytest.raises(Exception, match="Vault connection failed"):
+        run_pipeline("raw/test.csv")
 
 
-def test_run_pipeline_minio_error():
+def test_run_pipeline_minio_error(pipeline_mocks):
     """Test pipeline with MinIO connection error."""
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        with patch("dags.src.pipeline.get_minio_client") as mock_minio:
-            mock_vault.return_value = MagicMock()
-            mock_response = Mock()
-            mock_response.status = 500
-            mock_minio.side_effect = S3Error(
-                response=mock_response,
-                code="ConnectionError",
-                message="MinIO failed",
-                resource="minio:9000",
-                request_id="req123",
-                host_id="host456",
-            )
-
-            with pytest.raises(S3Error):
-                run_pipeline("raw/test.csv")
-
-
-def test_run_pipeline_transformation_error(sample_sales_data):
+    mock_response = Mock()
+    mock_response.status = 500
+    pipeline_mocks.get_minio_client.side_effect = S3Error(
+        response=mock_response,
+        code="ConnectionError",
+        message="MinIO failed",
+        resource="minio:9000",
+        request_id="req123",
+        host_id="host456",
+    )
+
+    with pytest.raises(S3Error):
+        run_pipeline("raw/test.csv")
+
+
+def test_run_pipeline_transformation_error(pipeline_mocks, sample_sales_data):
     """Test pipeline with transformation error."""
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        with patch("dags.src.pipeline.get_minio_client") as mock_minio:
-            with patch("dags.src.pipeline.get_object_size") as mock_size:
-                with patch("dags.src.pipeline.get_raw_data") as mock_get_data:
-                    with patch("dags.src.pipeline.validate_data") as mock_validate:
-                        with patch("dags.src.pipeline.transform_sales_data") as mock_transform:
-                            # Setup mocks
-                            mock_vault.return_value = MagicMock()
-                            mock_minio.return_value = MagicMock()
-                            mock_size.return_value = 1024
-                            mock_get_data.return_value = sample_sales_data
-                            mock_validate.return_value = (
-                                sample_sales_data,
-                                pd.DataFrame(),
-                            )
-                            mock_transform.side_effect = Exception("Transformation failed")
-
-                            with pytest.raises(Exception, match="Transformation failed"):
-                                run_pipeline("raw/test.csv")
-
-
-def test_run_pipeline_database_error(sample_sales_data):
+    mocks = pipeline_mocks
+    mocks.get_raw_data.return_value = sample_sales_data
+    mocks.validate_data.return_value = (sample_sales_data, pd.DataFrame())
+    mocks.transform_sales_data.side_effect = Exception("Transformation failed")
+
+    with pytest.raises(Exception, match="Transformation failed"):
+        run_pipeline("raw/test.csv")
+
+
+def test_run_pipeline_database_error(pipeline_mocks, sample_sales_data):
     """Test pipeline with database loading error."""
-    with patch("dags.src.pipeline.get_vault_client") as mock_vault:
-        with patch("dags.src.pipeline.get_minio_client") as mock_minio:
-            with patch("dags.src.pipeline.get_object_size") as mock_size:
-                with patch("dags.src.pipeline.get_raw_data") as mock_get_data:
-                    with patch("dags.src.pipeline.validate_data") as mock_validate:
-                        with patch("dags.src.pipeline.transform_sales_data") as mock_transform:
-                            with patch("dags.src.pipeline.upsert_data") as mock_upsert:
-                                # Setup mocks
-                                mock_vault.return_value = MagicMock()
-                                mock_minio.return_value = MagicMock()
-                                mock_size.return_value = 1024
-                                mock_get_data.return_value = sample_sales_data
-                                mock_validate.return_value = (
-                                    sample_sales_data,
-                                    pd.DataFrame(),
-                                )
-                                mock_transform.return_value = sample_sales_data
-                                mock_upsert.side_effect = Exception("Database error")
-
-                                with pytest.raises(Exception, match="Database error"):
-                                    run_pipeline("raw/test.csv")
+    mocks = pipeline_mocks
+    mocks.get_raw_data.return_value = sample_sales_data
+    mocks.validate_data.return_value = (sample_sales_data, pd.DataFrame())
+    mocks.transform_sales_data.return_value = sample_sales_data
+    mocks.upsert_data.side_effect = Exception("Database error")
+
+    with pytest.raises(Exception, match="Database error"):
+        run_pipeline("raw/test.csv")
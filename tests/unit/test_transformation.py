@@ -1,5 +1,9 @@
 """Unit tests for data transformation module."""
 
+import hashlib
+
+import pandas as pd
+
 from dags.src.transformation.transformer import transform_sales_data
 
 
@@ -22,6 +26,31 @@ def test_transform_anonymizes_pii(sample_sales_data):
     assert "customer_address" not in transformed_df.columns
 
 
+def test_transform_hashes_repeated_emails(sample_sales_data):
+    """Test that repeated emails hash to the same SHA-256 digest per row."""
+    df = pd.concat([sample_sales_data, sample_sales_data], ignore_index=True)
+    transformed_df = transform_sales_data(df)
+
+    expected = [hashlib.sha256(email.encode()).hexdigest() for email in df["customer_email"]]
+    assert transformed_df["customer_email_hash"].tolist() == expected
+
+
+def test_transform_redacts_phone_formats(sample_sales_data):
+    """Test that phone redaction keeps the last 4 digits in any format."""
+    df = pd.concat([sample_sales_data] * 2, ignore_index=True)
+    df["customer_phone"] = ["(555) 123-4567", "123", "+1 555 000 9999", "555.0100"]
+
+    transformed_df = transform_sales_data(df)
+
+    assert transformed_df["customer_phone_redacted"].tolist() == [
+        "***-***-4567",
+        "***-***-****",
+        "***-***-9999",
+        "***-***-0100",
+    ]
+    assert (transformed_df["customer_address_redacted"] == "*** **** **").all()
+
+
 def test_transform_calculates_profit(sample_sales_data):
     """Test that profit is calculated correctly."""
     transformed_df = transform_sales_data(sample_sales_data)
@@ -49,3 +78,14 @@ def test_transform_preserves_original(sample_sales_data):
     _ = transform_sales_data(sample_sales_data)
 
     assert list(sample_sales_data.columns) == original_cols
+
+
+def test_transform_preserves_original_values(mutable_sales_data):
+    """Test that rounding and date conversion don't write into the input arrays."""
+    mutable_sales_data["discounted_price"] = [10.555, 20.444]
+    mutable_sales_data["order_date"] = ["2025-10-01", "2025-10-02"]
+    snapshot = mutable_sales_data.copy()
+
+    transform_sales_data(mutable_sales_data)
+
+    pd.testing.assert_frame_equal(mutable_sales_data, snapshot)
@@ -1,9 +1,12 @@
 """Unit tests for data validation module."""
 
-import pandas as pd
+from unittest.mock import patch
+
+import pytest
+from pydantic import TypeAdapter
 
 from dags.src.utils.schemas import SalesRecord
-from dags.src.validation.validator import validate_data
+from dags.src.validation.validator import _list_adapter, validate_data
 
 
 def test_validate_valid_data(sample_sales_data):
@@ -24,11 +27,45 @@ def test_validate_invalid_data(sample_invalid_data):
     assert "validation_error" in invalid_df.columns
 
 
-def test_validate_mixed_data(sample_sales_data, sample_invalid_data):
+def test_validate_mixed_data(sample_mixed_data):
     """Test validation with mixed valid and invalid data."""
-    mixed_data = pd.concat([sample_sales_data, sample_invalid_data], ignore_index=True)
-
-    valid_df, invalid_df = validate_data(mixed_data, SalesRecord)
+    valid_df, invalid_df = validate_data(sample_mixed_data, SalesRecord)
 
     assert len(valid_df) == 2
     assert len(invalid_df) == 1
+
+
+def test_validate_list_of_frames(sample_sales_data, sample_invalid_data):
+    """Test a list of frames is validated chunk by chunk without concatenating."""
+    results = list(validate_data([sample_sales_data, sample_invalid_data], SalesRecord))
+
+    assert [(len(valid), len(invalid)) for valid, invalid in results] == [(2, 0), (0, 1)]
+
+
+def test_validate_rejects_non_frame_input():
+    """Test strings are rejected rather than iterated as chunks."""
+    with pytest.raises(TypeError, match="Iterable"):
+        validate_data("raw/test.csv", SalesRecord)
+
+
+def test_validate_reports_errors_by_row_label(sample_sales_data, sample_mixed_data):
+    """Test invalid rows keep their index label and per-field error messages."""
+    mixed_data = sample_mixed_data.set_axis([10, 20, 30])
+
+    valid_df, invalid_df = validate_data(mixed_data, SalesRecord)
+
+    assert valid_df["order_id"].tolist() == sample_sales_data["order_id"].tolist()
+    assert invalid_df["row_index"].tolist() == [30]
+    assert invalid_df["validation_error"].iloc[0].startswith("order_id: ")
+
+
+def test_validate_reuses_list_validator(sample_sales_data):
+    """Test the list validator is built once per schema, not per call."""
+    _list_adapter.cache_clear()
+
+    with patch("dags.src.validation.validator.TypeAdapter", wraps=TypeAdapter) as adapter_cls:
+        validate_data(sample_sales_data, SalesRecord)
+        validate_data(sample_sales_data, SalesRecord)
+
+    adapter_cls.assert_called_once_with(list[SalesRecord])
+    _list_adapter.cache_clear()